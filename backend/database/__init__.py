@@ -61,6 +61,7 @@ from backend.database.crud import (
     save_match,
     save_matches,
     get_matches_by_search_term,
+    get_matches_grouped_by_search_term,
     get_all_matches,
     get_new_matches,
     # App settings & new match detection
@@ -134,6 +135,7 @@ __all__ = [
     "save_match",
     "save_matches",
     "get_matches_by_search_term",
+    "get_matches_grouped_by_search_term",
     "get_all_matches",
     "get_new_matches",
     # CRUD - App Settings & New Match Detection
@@ -11,7 +11,7 @@ Provides functions for:
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from backend.database.models import AppSettings, CrawlLog, ExcludeTerm, Match, SearchTerm, Source
 from backend.utils.logging import get_logger
@@ -939,6 +939,30 @@ def get_matches_by_search_term(
     ).order_by(Match.created_at.desc()).all()
 
 
+def get_matches_grouped_by_search_term(session: Session) -> Dict[int, List[Match]]:
+    """
+    Get all matches grouped by search term, newest first within each group.
+
+    Loads every match in one query (plus one for their sources) instead of
+    one query per search term, for pages that show all groups at once.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Dict mapping search term ID to its Match records; terms without
+        matches are absent
+    """
+    matches = session.query(Match).options(
+        selectinload(Match.source)
+    ).order_by(Match.created_at.desc()).all()
+
+    grouped: Dict[int, List[Match]] = {}
+    for match in matches:
+        grouped.setdefault(match.search_term_id, []).append(match)
+    return grouped
+
+
 def get_all_matches(session: Session) -> List[Match]:
     """
     Get all matches ordered by creation date (newest first).
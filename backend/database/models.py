@@ -21,9 +21,11 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -223,6 +225,15 @@ class Match(TimestampMixin, Base):
     """
 
     __tablename__ = "matches"
+    __table_args__ = (
+        # Partial index: only unseen matches are indexed, keeping it small while
+        # serving the is_new filters in get_new_match_count/mark_matches_as_seen
+        Index(
+            "ix_matches_is_new",
+            "is_new",
+            sqlite_where=text("is_new = 1"),
+        ),
+    )
 
     # Foreign keys (using <singular>_id pattern per architecture)
     source_id = Column(
@@ -26,11 +26,13 @@ Logging:
         - LOG_BACKUP_COUNT: Number of backup files (default: 3)
 """
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 from urllib.parse import unquote
 
 from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import text
@@ -59,7 +61,7 @@ from backend.database import (
     clear_source_error,
     move_source_up,
     move_source_down,
-    get_matches_by_search_term,
+    get_matches_grouped_by_search_term,
     get_new_match_count,
     mark_matches_as_seen,
     clear_all_matches,
@@ -75,11 +77,11 @@ from backend.database import (
     DATABASE_PATH,
 )
 from backend.services.crawler import (
+    CrawlState,
     run_crawl_async,
     is_crawl_running,
     get_crawl_state,
     get_last_crawl_result,
-    get_crawl_log,
     request_crawl_cancel,
     prepare_crawl_state,
     ensure_sources_exist,
@@ -93,6 +95,15 @@ logger = get_logger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 
+# Schema inspection queries used by verify_database()
+_ALEMBIC_VERSION_TABLE_QUERY = text(
+    "SELECT name FROM sqlite_master WHERE type='table' AND name='alembic_version'"
+)
+_ALL_TABLES_QUERY = text("SELECT name FROM sqlite_master WHERE type='table'")
+
+# The health payload never changes, so it is serialized once and reused
+_HEALTH_RESPONSE = JSONResponse({"status": "healthy"})
+
 
 def verify_database() -> None:
     """
@@ -119,9 +130,7 @@ def verify_database() -> None:
     try:
         with engine.connect() as conn:
             # Check for alembic_version table (indicates migrations have been run)
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table' AND name='alembic_version'")
-            )
+            result = conn.execute(_ALEMBIC_VERSION_TABLE_QUERY)
             if result.fetchone() is None:
                 logger.warning(
                     "Alembic version table not found. "
@@ -131,9 +140,7 @@ def verify_database() -> None:
 
             # Check for expected application tables
             expected_tables = ['search_terms', 'sources', 'matches']
-            result = conn.execute(
-                text("SELECT name FROM sqlite_master WHERE type='table'")
-            )
+            result = conn.execute(_ALL_TABLES_QUERY)
             existing_tables = {row[0] for row in result.fetchall()}
 
             missing_tables = set(expected_tables) - existing_tables
@@ -206,19 +213,6 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 # Templates with absolute path
 templates = Jinja2Templates(directory=str(FRONTEND_DIR / "templates"))
 
-# Custom Jinja2 filter to calculate age in days
-def age_in_days_filter(created_at):
-    """Calculate age in days from created_at timestamp. Returns 1 for today, 2 for yesterday, etc."""
-    if not created_at:
-        return 0
-    from datetime import datetime, timezone
-    now = datetime.now(timezone.utc)
-    created_utc = created_at.replace(tzinfo=timezone.utc) if created_at.tzinfo is None else created_at
-    days = (now - created_utc).days
-    return max(1, days + 1)
-
-templates.env.filters["age_in_days"] = age_in_days_filter
-
 
 def format_duration(seconds: Optional[float]) -> str:
     """
@@ -294,7 +288,6 @@ async def dashboard(
     favorites_only = favorites_only_param.lower() == "true"
 
     # Calculate the cutoff date based on time filter
-    from datetime import datetime, timezone, timedelta
     now = datetime.now(timezone.utc)
     time_filter_days = {
         "1d": 1,
@@ -337,8 +330,11 @@ async def dashboard(
     total_new_count = 0
     seen_urls = set()  # Track URLs already shown by earlier search terms
 
+    # Load all matches (with their sources) at once instead of per term
+    matches_by_term = get_matches_grouped_by_search_term(db)
+
     for term in search_terms:
-        all_matches = get_matches_by_search_term(db, term.id)
+        all_matches = matches_by_term.get(term.id, [])
 
         # Filter by selected sources
         source_filtered_matches = [m for m in all_matches if m.source_id in selected_source_ids]
@@ -413,7 +409,7 @@ async def dashboard(
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
 
 
 # =============================================================================
@@ -988,7 +984,11 @@ async def move_source_down_route(
 
 
 @app.get("/admin/crawl")
-async def admin_crawl_status(request: Request, db: Session = Depends(get_db)):
+async def admin_crawl_status(
+    request: Request,
+    db: Session = Depends(get_db),
+    crawl_state: CrawlState = Depends(get_crawl_state),
+):
     """
     Admin page for crawl control and status.
 
@@ -998,21 +998,24 @@ async def admin_crawl_status(request: Request, db: Session = Depends(get_db)):
     - Manual crawl trigger button
     - Crawl history (Letzte Crawls tab)
     """
-    crawl_state = get_crawl_state()
     crawl_logs = get_crawl_logs(db, limit=50)
     return templates.TemplateResponse("admin/crawl_status.html", {"request": request,
             "title": "Crawl-Status",
             "is_running": crawl_state.is_running,
             "current_source": crawl_state.current_source,
             "last_result": crawl_state.last_result,
-            "log_messages": get_crawl_log(),
+            "log_messages": crawl_state.log_messages,
             "crawl_logs": crawl_logs,
         }
     )
 
 
 @app.post("/admin/crawl/start")
-async def start_crawl(request: Request, db: Session = Depends(get_db)):
+async def start_crawl(
+    request: Request,
+    db: Session = Depends(get_db),
+    crawl_state: CrawlState = Depends(get_crawl_state),
+):
     """
     Start a manual crawl via HTMX request.
 
@@ -1022,8 +1025,7 @@ async def start_crawl(request: Request, db: Session = Depends(get_db)):
     import asyncio
 
     # Check if already running
-    if is_crawl_running():
-        crawl_state = get_crawl_state()
+    if is_crawl_running(crawl_state):
         # Get info about who holds the lock (for cross-process detection)
         lock_holder = get_lock_holder_info()
         if lock_holder:
@@ -1035,7 +1037,7 @@ async def start_crawl(request: Request, db: Session = Depends(get_db)):
                 "is_running": True,
                 "current_source": crawl_state.current_source,
                 "last_result": crawl_state.last_result,
-                "log_messages": get_crawl_log(),
+                "log_messages": crawl_state.log_messages,
                 "crawl_logs": crawl_logs,
                 "error": error_msg,
             }
@@ -1044,13 +1046,12 @@ async def start_crawl(request: Request, db: Session = Depends(get_db)):
     # Check if there are active search terms
     active_terms = get_active_search_terms(db)
     if not active_terms:
-        crawl_state = get_crawl_state()
         crawl_logs = get_crawl_logs(db, limit=50)
         return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
                 "is_running": False,
                 "current_source": None,
                 "last_result": crawl_state.last_result,
-                "log_messages": get_crawl_log(),
+                "log_messages": crawl_state.log_messages,
                 "crawl_logs": crawl_logs,
                 "error": "Kein Crawl möglich: Bitte zuerst Suchbegriffe erfassen.",
             }
@@ -1058,7 +1059,7 @@ async def start_crawl(request: Request, db: Session = Depends(get_db)):
 
     # Prepare crawl state BEFORE creating background task to avoid race conditions
     # This ensures polling sees is_running=True immediately
-    prepare_crawl_state()
+    prepare_crawl_state(crawl_state)
 
     # Start crawl in background task
     async def run_crawl_background():
@@ -1076,27 +1077,29 @@ async def start_crawl(request: Request, db: Session = Depends(get_db)):
     asyncio.create_task(run_crawl_background())
 
     # Return immediately with running state
-    crawl_state = get_crawl_state()
     crawl_logs = get_crawl_logs(db, limit=50)
     return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
             "is_running": crawl_state.is_running,
             "current_source": crawl_state.current_source,
             "last_result": crawl_state.last_result,
-            "log_messages": get_crawl_log(),
+            "log_messages": crawl_state.log_messages,
             "crawl_logs": crawl_logs,
         }
     )
 
 
 @app.get("/admin/crawl/status")
-async def get_crawl_status_partial(request: Request, db: Session = Depends(get_db)):
+async def get_crawl_status_partial(
+    request: Request,
+    db: Session = Depends(get_db),
+    crawl_state: CrawlState = Depends(get_crawl_state),
+):
     """
     Get current crawl status partial for HTMX polling.
 
     Used for real-time status updates during crawl.
     Includes progress tracking (sources done/total) and ETA estimation.
     """
-    crawl_state = get_crawl_state()
     crawl_logs = get_crawl_logs(db, limit=50)
 
     # Get average crawl duration for ETA calculation
@@ -1107,7 +1110,7 @@ async def get_crawl_status_partial(request: Request, db: Session = Depends(get_d
             "is_running": crawl_state.is_running,
             "current_source": crawl_state.current_source,
             "last_result": crawl_state.last_result,
-            "log_messages": get_crawl_log(),
+            "log_messages": crawl_state.log_messages,
             "crawl_logs": crawl_logs,
             # Progress tracking
             "sources_total": crawl_state.sources_total,
@@ -1119,15 +1122,18 @@ async def get_crawl_status_partial(request: Request, db: Session = Depends(get_d
 
 
 @app.post("/admin/crawl/cancel")
-async def cancel_crawl(request: Request, db: Session = Depends(get_db)):
+async def cancel_crawl(
+    request: Request,
+    db: Session = Depends(get_db),
+    crawl_state: CrawlState = Depends(get_crawl_state),
+):
     """
     Cancel a running crawl via HTMX request.
 
     Returns the updated status partial for HTMX swap.
     """
     crawl_logs = get_crawl_logs(db, limit=50)
-    if not is_crawl_running():
-        crawl_state = get_crawl_state()
+    if not is_crawl_running(crawl_state):
         return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
                 "is_running": False,
                 "current_source": None,
@@ -1138,9 +1144,8 @@ async def cancel_crawl(request: Request, db: Session = Depends(get_db)):
         )
 
     # Request cancellation
-    request_crawl_cancel()
+    request_crawl_cancel(crawl_state)
 
-    crawl_state = get_crawl_state()
     return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
             "is_running": crawl_state.is_running,
             "current_source": crawl_state.current_source,
@@ -1152,7 +1157,11 @@ async def cancel_crawl(request: Request, db: Session = Depends(get_db)):
 
 
 @app.post("/admin/crawl/clear-db")
-async def clear_matches_db(request: Request, db: Session = Depends(get_db)):
+async def clear_matches_db(
+    request: Request,
+    db: Session = Depends(get_db),
+    crawl_state: CrawlState = Depends(get_crawl_state),
+):
     """
     Clear all matches from the database via HTMX request.
 
@@ -1160,13 +1169,12 @@ async def clear_matches_db(request: Request, db: Session = Depends(get_db)):
     Returns the updated status partial for HTMX swap.
     """
     crawl_logs = get_crawl_logs(db, limit=50)
-    if is_crawl_running():
-        crawl_state = get_crawl_state()
+    if is_crawl_running(crawl_state):
         return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
                 "is_running": True,
                 "current_source": crawl_state.current_source,
                 "last_result": crawl_state.last_result,
-                "log_messages": get_crawl_log(),
+                "log_messages": crawl_state.log_messages,
                 "crawl_logs": crawl_logs,
                 "error": "Kann Datenbank nicht leeren während ein Crawl läuft.",
             }
@@ -1174,12 +1182,11 @@ async def clear_matches_db(request: Request, db: Session = Depends(get_db)):
 
     count = clear_all_matches(db)
 
-    crawl_state = get_crawl_state()
     return templates.TemplateResponse("admin/_partials/_crawl_status.html", {"request": request,
             "is_running": False,
             "current_source": None,
             "last_result": crawl_state.last_result,
-            "log_messages": get_crawl_log(),
+            "log_messages": crawl_state.log_messages,
             "crawl_logs": crawl_logs,
             "success": f"Datenbank geleert ({count} Treffer gelöscht).",
         }
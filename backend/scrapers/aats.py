@@ -60,6 +60,9 @@ async def scrape_aats(search_terms: Optional[List[str]] = None) -> ScraperResult
         logger.warning(f"{SOURCE_NAME} - No search terms to search for")
         return []
 
+    # Lowercase the search terms once; matching and logging both use them
+    terms_lower = [term.lower() for term in search_terms]
+
     results: ScraperResults = []
     seen_urls = set()
 
@@ -79,8 +82,9 @@ async def scrape_aats(search_terms: Optional[List[str]] = None) -> ScraperResult
 
             add_crawl_log(f"  {len(product_urls)} Produkte in Sitemap gefunden")
 
-            # Convert search terms to lowercase for matching
-            search_patterns = [term.lower() for term in search_terms]
+            # Match all search terms with one alternation, so each slug is
+            # scanned once instead of once per term
+            term_pattern = re.compile("|".join(re.escape(term) for term in terms_lower))
 
             # Match products against search terms
             for url in product_urls:
@@ -101,36 +105,38 @@ async def scrape_aats(search_terms: Optional[List[str]] = None) -> ScraperResult
                 # Replace hyphens with spaces for better matching
                 slug_searchable = slug_decoded.replace('-', ' ')
 
-                # Check if any search term matches the slug
-                for term in search_patterns:
-                    term_lower = term.lower()
-                    # Match if term is found in slug (with hyphens or spaces)
-                    if term_lower in slug_searchable or term_lower in slug_decoded:
-                        if url in seen_urls:
-                            continue
-                        seen_urls.add(url)
-
-                        # Create title from slug (convert hyphens to spaces, capitalize)
-                        title = slug_decoded.replace('-', ' ').title()
-
-                        # Remove trailing ID/SKU patterns (e.g., "-12345" at end)
-                        title = re.sub(r'\s+\d+$', '', title)
-                        title = re.sub(r'\s+[a-z0-9]{5,}$', '', title, flags=re.IGNORECASE)
-
-                        result = ScraperResult(
-                            title=title,
-                            price=None,  # Price not available without JS rendering
-                            image_url=None,  # Image not available without JS rendering
-                            link=url,
-                            source=SOURCE_NAME,
-                        )
-                        results.append(result)
-                        break  # Don't add same product multiple times
+                # Check if any search term matches the slug (with hyphens or spaces)
+                if not (
+                    term_pattern.search(slug_searchable)
+                    or term_pattern.search(slug_decoded)
+                ):
+                    continue
+
+                # Don't add same product multiple times
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+
+                # Create title from slug (convert hyphens to spaces, capitalize)
+                title = slug_decoded.replace('-', ' ').title()
+
+                # Remove trailing ID/SKU patterns (e.g., "-12345" at end)
+                title = re.sub(r'\s+\d+$', '', title)
+                title = re.sub(r'\s+[a-z0-9]{5,}$', '', title, flags=re.IGNORECASE)
+
+                result = ScraperResult(
+                    title=title,
+                    price=None,  # Price not available without JS rendering
+                    image_url=None,  # Image not available without JS rendering
+                    link=url,
+                    source=SOURCE_NAME,
+                )
+                results.append(result)
 
             # Log results per search term
-            for term in search_terms:
-                term_lower = term.lower()
-                count = sum(1 for r in results if term_lower in r['title'].lower())
+            titles_lower = [r['title'].lower() for r in results]
+            for term, term_lower in zip(search_terms, terms_lower):
+                count = sum(1 for title in titles_lower if term_lower in title)
                 if count > 0:
                     add_crawl_log(f"    '{term}': {count} Treffer")
 
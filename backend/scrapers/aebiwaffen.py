@@ -24,6 +24,14 @@ BASE_URL = "https://www.aebiwaffen.ch"
 LISTINGS_URL = f"{BASE_URL}/de/waffen-neu-waffen-gebraucht-waffen"
 SOURCE_NAME = "aebiwaffen.ch"
 MAX_PAGES = 70  # Site has ~66 pages, allow some buffer
+NEXT_LINK_TEXTS = ("»", "Weiter", "Nächste")
+
+# Swiss price format: digits with apostrophe thousands separator, then .00 / Stk.
+# Pattern: 1'234.56 / Stk. or 1234.00 / Stk.
+STK_PRICE_PATTERN = re.compile(r"([\d']+\.?\d*)\s*/\s*Stk\.")
+CHF_PRICE_PATTERN = re.compile(r"(?:CHF|Fr\.?)\s*([\d',.]+)|([\d',.]+)\s*(?:CHF|Fr\.?)")
+# Product links have format /de/{id}/{slug}
+PRODUCT_PATH_PATTERN = re.compile(r"/de/\d+/")
 
 
 async def scrape_aebiwaffen() -> ScraperResults:
@@ -113,18 +121,23 @@ async def scrape_aebiwaffen() -> ScraperResults:
 
 def _has_next_page(soup: BeautifulSoup, current_page: int) -> bool:
     """Check if there's a next page link in pagination."""
-    # Look for pagination links with seite parameter
-    next_page_num = current_page + 1
-    next_link = soup.select_one(f"a[href*='seite={next_page_num}']")
-    if next_link:
-        return True
-
-    # Look for "next" style links
-    next_link = soup.select_one(
-        "a.next, a[rel='next'], "
-        "a:-soup-contains('»'), a:-soup-contains('Weiter'), a:-soup-contains('Nächste')"
-    )
-    return next_link is not None
+    # One pass over the links with plain string checks instead of CSS
+    # selectors; the :-soup-contains() variant re-reads every link's text
+    # per pattern. Stops at the first link that points to a next page.
+    next_page_param = f"seite={current_page + 1}"
+    for link in soup.find_all("a"):
+        # Pagination link with seite parameter
+        if next_page_param in link.get("href", ""):
+            return True
+
+        # "next" style links
+        if "next" in link.get("class", []) or link.get("rel") == ["next"]:
+            return True
+        text = link.get_text()
+        if any(marker in text for marker in NEXT_LINK_TEXTS):
+            return True
+
+    return False
 
 
 def _is_available(listing: Tag) -> bool:
@@ -218,7 +231,7 @@ def _extract_link(listing: Tag) -> Optional[str]:
             if isinstance(href, list):
                 href = href[0]
             # Verify it looks like a product URL (has numeric ID)
-            if re.search(r"/de/\d+/", href):
+            if PRODUCT_PATH_PATTERN.search(href):
                 return make_absolute_url(BASE_URL, href)
 
     return None
@@ -234,16 +247,14 @@ def _extract_price(listing: Tag) -> Optional[float]:
     # U+2019 (') RIGHT SINGLE QUOTATION MARK is commonly used
     text = text.replace("\u2019", "'").replace("\u2018", "'")
 
-    # Swiss price format: digits with apostrophe thousands separator, then .00 / Stk.
-    # Pattern: 1'234.56 / Stk. or 1234.00 / Stk.
-    match = re.search(r"([\d']+\.?\d*)\s*/\s*Stk\.", text)
+    match = STK_PRICE_PATTERN.search(text)
     if match:
         price_str = match.group(1)
         return parse_price(price_str)
 
     # Fallback: look for CHF pattern
     if "CHF" in text or "Fr." in text:
-        match = re.search(r"(?:CHF|Fr\.?)\s*([\d',.]+)|([\d',.]+)\s*(?:CHF|Fr\.?)", text)
+        match = CHF_PRICE_PATTERN.search(text)
         if match:
             price_str = match.group(1) or match.group(2)
             return parse_price(price_str)
@@ -26,6 +26,11 @@ import httpx
 REQUEST_TIMEOUT = 30  # seconds
 REQUEST_DELAY_MIN = 2  # seconds between requests
 REQUEST_DELAY_MAX = 5  # seconds between requests
+KEEPALIVE_EXPIRY = 30  # seconds an idle connection is kept for reuse
+
+# Patterns used by parse_price, compiled once at import
+PRICE_JUNK_PATTERN = re.compile(r"[^\d.,']")
+DOT_THOUSANDS_PATTERN = re.compile(r"^(\d+)\.(\d{3})$")
 
 
 class ScraperResult(TypedDict, total=False):
@@ -68,6 +73,7 @@ def create_http_client() -> httpx.AsyncClient:
     The client is configured with:
     - 30 second timeout for all operations
     - Proper User-Agent header
+    - Idle connections kept alive across the delays between requests
     - Redirect following enabled
     - SSL verification disabled (required for some sites)
 
@@ -80,6 +86,12 @@ def create_http_client() -> httpx.AsyncClient:
     return httpx.AsyncClient(
         timeout=httpx.Timeout(REQUEST_TIMEOUT),
         headers={"User-Agent": get_user_agent()},
+        # Explicit Limits replace httpx's defaults, so restate its pool caps
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
         follow_redirects=True,
         verify=False
     )
@@ -111,6 +123,9 @@ def make_absolute_url(base_url: str, relative_url: str) -> str:
         >>> make_absolute_url("https://example.ch/", "https://cdn.example.ch/img.jpg")
         'https://cdn.example.ch/img.jpg'
     """
+    # Most scraped links are already absolute; skip urljoin's parsing for them
+    if relative_url.startswith(("https://", "http://")):
+        return relative_url
     return urljoin(base_url, relative_url)
 
 
@@ -151,7 +166,7 @@ def parse_price(price_str: Optional[str]) -> Optional[float]:
         return None
 
     # Remove currency symbols, spaces, and non-numeric characters except ., and '
-    cleaned = re.sub(r"[^\d.,']", "", price_str)
+    cleaned = PRICE_JUNK_PATTERN.sub("", price_str)
 
     # Remove Swiss thousands separator (apostrophe)
     cleaned = cleaned.replace("'", "")
@@ -169,7 +184,7 @@ def parse_price(price_str: Optional[str]) -> Optional[float]:
         # Pattern: dot followed by exactly 3 digits at end = thousands separator
         # e.g., "1.550" = 1550, "2.500" = 2500
         # But "1.50" or "1.5" = decimal
-        match = re.match(r"^(\d+)\.(\d{3})$", cleaned)
+        match = DOT_THOUSANDS_PATTERN.match(cleaned)
         if match:
             # Dot is thousands separator (e.g., "1.550" -> "1550")
             cleaned = cleaned.replace(".", "")
@@ -26,6 +26,8 @@ BASE_URL = "https://egun.de/market"
 SEARCH_URL = f"{BASE_URL}/list_items.php"
 SOURCE_NAME = "egun.de"
 MAX_PAGES = 5  # Max pages per search term
+ITEM_ID_PATTERN = re.compile(r"id=(\d+)")
+PAGE_PARAM_PATTERN = re.compile(r"page=(\d+)")
 
 
 async def scrape_egun(search_terms: Optional[List[str]] = None) -> ScraperResults:
@@ -107,7 +109,7 @@ async def scrape_egun(search_terms: Optional[List[str]] = None) -> ScraperResult
                         try:
                             # Extract item ID to avoid duplicates on same page
                             href = link.get("href", "")
-                            id_match = re.search(r"id=(\d+)", href)
+                            id_match = ITEM_ID_PATTERN.search(href)
                             if not id_match:
                                 continue
                             item_id = id_match.group(1)
@@ -179,14 +181,11 @@ def _find_parent_row(element: Tag) -> Optional[Tag]:
 def _has_next_page(soup: BeautifulSoup, current_page: int) -> bool:
     """Check if there's a next page link in pagination."""
     # Look for page links like "Seite 2", "Seite 3", etc.
-    page_links = soup.find_all("a", href=re.compile(r"page=\d+"))
-    for link in page_links:
-        href = link.get("href", "")
-        match = re.search(r"page=(\d+)", href)
-        if match:
-            page_num = int(match.group(1))
-            if page_num > current_page:
-                return True
+    # One regex search per link both filters and extracts the page number
+    for link in soup.find_all("a", href=True):
+        match = PAGE_PARAM_PATTERN.search(link["href"])
+        if match and int(match.group(1)) > current_page:
+            return True
     return False
 
 
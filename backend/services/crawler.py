@@ -366,11 +366,15 @@ class CrawlState:
 _crawl_state = CrawlState()
 
 
+def _append_crawl_log(state: CrawlState, message: str) -> None:
+    """Add a timestamped log message to the given crawl state."""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    state.log_messages.append(f"[{timestamp}] {message}")
+
+
 def add_crawl_log(message: str) -> None:
     """Add a log message to the current crawl state."""
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    _crawl_state.log_messages.append(f"[{timestamp}] {message}")
+    _append_crawl_log(_crawl_state, message)
 
 
 def clear_crawl_log() -> None:
@@ -393,35 +397,42 @@ def get_crawl_state() -> CrawlState:
     return _crawl_state
 
 
-def is_crawl_running() -> bool:
+def is_crawl_running(state: CrawlState) -> bool:
     """
     Check if a crawl is currently running.
 
-    Checks both in-memory state (same process) and file lock (other processes).
+    Checks both the given in-memory state (same process) and the file lock
+    (other processes).
+
+    Args:
+        state: Crawl state to check, usually from get_crawl_state()
     """
     # Check in-memory state first
-    if _crawl_state.is_running:
+    if state.is_running:
         return True
     # Check file lock for cross-process detection
     return is_crawl_locked()
 
 
-def request_crawl_cancel() -> bool:
+def request_crawl_cancel(state: CrawlState) -> bool:
     """
     Request cancellation of the currently running crawl.
 
+    Args:
+        state: Crawl state of the running crawl
+
     Returns:
         True if a crawl was running and cancellation was requested,
         False if no crawl is running.
     """
-    if _crawl_state.is_running:
-        _crawl_state.cancel_requested = True
+    if state.is_running:
+        state.cancel_requested = True
         logger.info("Crawl cancellation requested")
         return True
     return False
 
 
-def prepare_crawl_state(trigger: str = "web") -> bool:
+def prepare_crawl_state(state: CrawlState, trigger: str = "web") -> bool:
     """
     Prepare the crawl state before starting a background crawl.
 
@@ -430,16 +441,15 @@ def prepare_crawl_state(trigger: str = "web") -> bool:
     Must be called BEFORE creating the background task to avoid race conditions.
 
     Args:
+        state: Crawl state to prepare, usually from get_crawl_state()
         trigger: What triggered the crawl ('web', 'cli', 'cronjob')
 
     Returns:
         True if state was prepared successfully,
         False if a crawl is already running (in this process or another).
     """
-    global _crawl_state
-
     # Check in-memory state first (same process)
-    if _crawl_state.is_running:
+    if state.is_running:
         logger.warning("Crawl already running in this process")
         return False
 
@@ -449,11 +459,11 @@ def prepare_crawl_state(trigger: str = "web") -> bool:
         logger.warning(f"Cannot start crawl - lock held by: {lock_holder}")
         return False
 
-    _crawl_state.is_running = True
-    _crawl_state.cancel_requested = False
-    _crawl_state.current_source = None
-    clear_crawl_log()
-    add_crawl_log("Crawl wird gestartet...")
+    state.is_running = True
+    state.cancel_requested = False
+    state.current_source = None
+    state.log_messages.clear()
+    _append_crawl_log(state, "Crawl wird gestartet...")
 
     return True
 
@@ -31,9 +31,10 @@ if not current_url or current_url == "sqlite:///data/yoga_helper.db":
     config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
+# This line sets up loggers basically. Keep already configured application
+# loggers enabled when migrations run in-process (e.g. from tests).
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # add your model's MetaData object here
 # for 'autogenerate' support
@@ -0,0 +1,35 @@
+"""Add partial index on matches.is_new.
+
+Speeds up the new-match count and mark-as-seen queries, which filter on
+is_new = 1. Only unseen matches are indexed, so the index stays small.
+
+Revision ID: 006_match_is_new_index
+Revises: 234087b03c66
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_match_is_new_index'
+down_revision: Union[str, None] = '234087b03c66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_matches_is_new',
+        'matches',
+        ['is_new'],
+        unique=False,
+        sqlite_where=sa.text('is_new = 1'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_matches_is_new', table_name='matches')
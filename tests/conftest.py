@@ -3,6 +3,7 @@ Pytest configuration and fixtures for Gilbert's Yoga Helper tests.
 """
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -10,88 +11,175 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
-from backend.main import app
-from backend.database.connection import Base
-from backend.services.crawler import _crawl_state, clear_crawl_log
+from backend.main import app, templates
+from backend.database.connection import Base, engine as app_engine
+
+
+def set_test_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Trade durability for speed on test databases.
+
+    WAL avoids copying pages to a rollback journal, synchronous=NORMAL skips
+    the fsync on every commit and temp_store=MEMORY keeps temp tables in RAM.
+    Only used for test engines; the production engine keeps its own pragmas.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_savepoint_engine(url, on_connect=None, **engine_kwargs):
+    """
+    Create a SQLite test engine with the full schema and SAVEPOINT support.
+
+    pysqlite emits BEGIN on its own and breaks SAVEPOINTs, so transaction
+    control is handed to SQLAlchemy: the driver's isolation level is
+    disabled on connect and BEGIN is emitted by the "begin" event.
+
+    Args:
+        url: SQLite database URL
+        on_connect: Optional extra connect hook, e.g. set_test_sqlite_pragmas
+        **engine_kwargs: Passed on to create_engine (e.g. poolclass)
+    """
+    engine = create_engine(
+        url, connect_args={"check_same_thread": False}, **engine_kwargs
+    )
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        if on_connect is not None:
+            on_connect(dbapi_connection, connection_record)
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@contextmanager
+def savepoint_sessions(engine, **session_kwargs):
+    """
+    Yield a session factory whose changes are rolled back on exit.
+
+    Sessions are bound to a connection whose outer transaction is rolled
+    back afterwards. Session commits only release a SAVEPOINT, which is
+    restarted right away, so code under test can commit freely.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    nested = connection.begin_nested()
+
+    factory = sessionmaker(bind=connection, **session_kwargs)
+
+    @event.listens_for(factory, "after_transaction_end")
+    def restart_savepoint(session, trans):
+        nonlocal nested
+        if not nested.is_active:
+            nested = connection.begin_nested()
+
+    try:
+        yield factory
+    finally:
+        event.remove(factory, "after_transaction_end", restart_savepoint)
+        transaction.rollback()
+        connection.close()
+
+
+# Templates don't change during a test run; skip the mtime check that
+# auto_reload does for every template (and include) on each render
+templates.env.auto_reload = False
 
 
 @pytest.fixture(autouse=True)
-def reset_crawl_state():
-    """Reset global crawl state before each test to ensure test isolation."""
-    # Reset before test
-    _crawl_state.is_running = False
-    _crawl_state.cancel_requested = False
-    _crawl_state.current_source = None
-    _crawl_state.last_result = None
-    clear_crawl_log()
+def crawl_lock_path(tmp_path, monkeypatch):
+    """
+    Point the crawl lock at a per-test file instead of data/crawl.lock.
 
-    yield
+    Tests that start a crawl acquire the lock and, with the crawl mocked
+    out, never release it. A per-test path keeps such a lock from leaking
+    into later tests or into other pytest-xdist workers.
+    """
+    lock_path = tmp_path / "crawl.lock"
+    monkeypatch.setattr("backend.services.crawler.LOCK_FILE_PATH", lock_path)
+    return lock_path
 
-    # Reset after test
-    _crawl_state.is_running = False
-    _crawl_state.cancel_requested = False
-    _crawl_state.current_source = None
-    _crawl_state.last_result = None
-    clear_crawl_log()
 
+@pytest.fixture(scope="session", autouse=True)
+def dispose_app_engine():
+    """
+    Close the app engine's pooled connections once the session ends.
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    with TestClient(app) as test_client:
-        yield test_client
+    Tests that go through SessionLocal or startup check out connections to
+    data/yoga_helper.db; disposing here closes them deterministically
+    instead of leaving it to garbage collection at interpreter exit.
+    """
+    yield
+    app_engine.dispose()
 
 
-@pytest.fixture
-def test_db():
+@pytest.fixture(scope="session")
+def client():
     """
-    Create an isolated test database for tests that need database isolation.
+    Create one test client for the whole session.
 
-    This fixture creates a temporary SQLite database with WAL mode enabled,
-    creates all tables, and cleans up after the test.
+    The client is not entered as a context manager, so no lifespan startup
+    runs; per-test state comes from dependency overrides. Modules that need
+    startup use a separately named lifespan_client.
+    """
+    return TestClient(app)
 
-    Usage:
-        def test_something(test_db):
-            session = test_db()
-            # ... use session
-            session.close()
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """
+    Create a temporary SQLite engine shared by the whole test session.
+
+    The schema is created once here; per-test isolation is provided by
+    test_db, which wraps each test in a transaction that is rolled back.
     """
     # Create temporary database file
     fd, db_path = tempfile.mkstemp(suffix=".db")
     os.close(fd)
 
-    # Create test engine with same settings as production
-    test_engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False},
-        echo=False,
+    engine = create_savepoint_engine(
+        f"sqlite:///{db_path}", on_connect=set_test_sqlite_pragmas
     )
 
-    # Enable WAL mode
-    @event.listens_for(test_engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA journal_mode=WAL")
-        cursor.close()
-
-    # Create all tables
-    Base.metadata.create_all(bind=test_engine)
-
-    # Create session factory
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
-
-    yield TestSessionLocal
+    yield engine
 
     # Cleanup
-    test_engine.dispose()
+    engine.dispose()
     # Remove temporary database files
-    db_path_obj = Path(db_path)
     for suffix in ["", "-wal", "-shm"]:
         file_path = Path(str(db_path) + suffix)
         if file_path.exists():
             file_path.unlink()
 
 
+@pytest.fixture
+def test_db(test_engine):
+    """
+    Provide an isolated session factory for tests that need database isolation.
+
+    Sessions are bound to a connection whose outer transaction is rolled back
+    after the test. Session commits only release a SAVEPOINT, which is
+    restarted automatically, so tests can commit freely without leaking rows.
+
+    Usage:
+        def test_something(test_db):
+            session = test_db()
+            # ... use session
+            session.close()
+    """
+    with savepoint_sessions(test_engine, autocommit=False, autoflush=False) as factory:
+        yield factory
+
+
 @pytest.fixture
 def test_session(test_db):
     """
@@ -0,0 +1,46 @@
+"""
+Assertion helpers shared by the test suite.
+"""
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List
+from unittest.mock import AsyncMock, patch
+
+
+def assert_all_in(haystack: str, needles: Iterable[str]) -> None:
+    """
+    Assert that every needle occurs in haystack.
+
+    All missing needles are reported together in one assertion message,
+    instead of stopping at the first one.
+    """
+    missing = [n for n in needles if n not in haystack]
+    assert not missing, f"Not found in text: {missing}"
+
+
+def tbody_positions(text: str, needles: Iterable[str]) -> List[int]:
+    """
+    Return the offset of each needle within the first <tbody> of text.
+
+    Needles that are missing (or a page without a table body) give -1.
+    Only the table body is searched, so form placeholders do not count.
+    """
+    start = text.find("<tbody")
+    body = text[start:text.find("</tbody>", start)] if start != -1 else ""
+    return [body.find(needle) for needle in needles]
+
+
+@contextmanager
+def patch_scraper(module: str, client: object) -> Iterator[None]:
+    """
+    Patch a scraper module for an offline scrape run.
+
+    create_http_client returns client, delay_between_requests becomes a no-op
+    and the crawl log is silenced. Both module-level targets are patched in
+    one patch.multiple call.
+    """
+    with patch.multiple(
+        module,
+        create_http_client=lambda: client,
+        delay_between_requests=AsyncMock(),
+    ), patch("backend.services.crawler.add_crawl_log"):
+        yield
@@ -34,6 +34,7 @@ from backend.database.crud import (
     get_last_seen_at,
     get_match_by_url_and_term,
     get_matches_by_search_term,
+    get_matches_grouped_by_search_term,
     get_new_match_count,
     get_new_matches,
     get_or_create_source,
@@ -601,6 +602,16 @@ class TestMatchQueries:
         assert "Glock 17" in titles
         assert "Glock 19" in titles
 
+    def test_get_matches_grouped_by_search_term(self, test_session, setup_matches):
+        """get_matches_grouped_by_search_term groups all matches by term."""
+        source, term1, term2 = setup_matches
+
+        grouped = get_matches_grouped_by_search_term(test_session)
+
+        assert set(grouped) == {term1.id, term2.id}
+        assert {m.title for m in grouped[term1.id]} == {"Glock 17", "Glock 19"}
+        assert [m.title for m in grouped[term2.id]] == ["SIG 550"]
+
     def test_get_all_matches(self, test_session, setup_matches):
         """get_all_matches returns all matches."""
         source, term1, term2 = setup_matches
@@ -8,6 +8,7 @@ Tests verify:
 - Downgrade removes tables
 - Schema matches SQLAlchemy model definitions
 """
+import copy
 import os
 import tempfile
 from pathlib import Path
@@ -28,6 +29,18 @@ ALEMBIC_INI = PROJECT_ROOT / "alembic.ini"
 MIGRATIONS_DIR = PROJECT_ROOT / "migrations"
 VERSIONS_DIR = MIGRATIONS_DIR / "versions"
 
+# Parse alembic.ini once; tests get shallow copies that only differ in URL.
+# Accessing file_config primes the memoized parse so every copy shares it.
+_ALEMBIC_CFG = Config(str(ALEMBIC_INI))
+_ = _ALEMBIC_CFG.file_config
+
+
+def make_alembic_config(db_path):
+    """Return a copy of the cached Alembic config pointing at db_path."""
+    alembic_cfg = copy.copy(_ALEMBIC_CFG)
+    alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    return alembic_cfg
+
 
 class TestAlembicConfiguration:
     """Tests for Alembic configuration files."""
@@ -131,8 +144,7 @@ class TestMigrationExecution:
         db_path, test_engine = temp_db
 
         # Create Alembic config for the test database
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
 
         # Run upgrade
         command.upgrade(alembic_cfg, "head")
@@ -146,8 +158,7 @@ class TestMigrationExecution:
         """Running upgrade should create search_terms table."""
         db_path, test_engine = temp_db
 
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
 
         command.upgrade(alembic_cfg, "head")
 
@@ -159,8 +170,7 @@ class TestMigrationExecution:
         """Running upgrade should create sources table."""
         db_path, test_engine = temp_db
 
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
 
         command.upgrade(alembic_cfg, "head")
 
@@ -172,8 +182,7 @@ class TestMigrationExecution:
         """Running upgrade should create matches table."""
         db_path, test_engine = temp_db
 
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
 
         command.upgrade(alembic_cfg, "head")
 
@@ -185,8 +194,7 @@ class TestMigrationExecution:
         """Running downgrade should remove application tables."""
         db_path, test_engine = temp_db
 
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
 
         # First upgrade
         command.upgrade(alembic_cfg, "head")
@@ -219,8 +227,7 @@ class TestSchemaMatchesModels:
         )
 
         # Run migrations
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
         command.upgrade(alembic_cfg, "head")
 
         yield test_engine
@@ -292,6 +299,14 @@ class TestSchemaMatchesModels:
         name_indexes = [idx for idx in indexes if 'name' in idx['column_names']]
         assert len(name_indexes) > 0, "No index found on name column"
 
+    def test_matches_has_is_new_index(self, migrated_db):
+        """matches should have an index on is_new column."""
+        inspector = inspect(migrated_db)
+        indexes = inspector.get_indexes('matches')
+
+        is_new_indexes = [idx for idx in indexes if idx['column_names'] == ['is_new']]
+        assert len(is_new_indexes) > 0, "No index found on is_new column"
+
 
 class TestModelsCrudAfterMigration:
     """Tests that models work correctly with migrated database."""
@@ -308,8 +323,7 @@ class TestModelsCrudAfterMigration:
         )
 
         # Run migrations
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+        alembic_cfg = make_alembic_config(db_path)
         command.upgrade(alembic_cfg, "head")
 
         # Create session
@@ -9,21 +9,58 @@ Tests verify:
 - FastAPI routes return correct responses
 """
 import os
+import sqlite3
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import DEFAULT, patch, Mock, MagicMock, AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from alembic import command
-from alembic.config import Config
 
-from backend.database.connection import PROJECT_ROOT
+# Schema setup statements, executed through the raw sqlite3 connection
+_CREATE_DUMMY_TABLE = "CREATE TABLE dummy (id INTEGER PRIMARY KEY)"
+_CREATE_ALEMBIC_VERSION_TABLE = (
+    "CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"
+)
+_INSERT_ALEMBIC_VERSION = "INSERT INTO alembic_version VALUES ('001_initial')"
 
+# Shared stand-in for the get_db session in route tests (reset per test by app_mocks)
+_MOCK_DB = Mock(spec=Session)
 
-ALEMBIC_INI = PROJECT_ROOT / "alembic.ini"
+
+@pytest.fixture
+def app_mocks():
+    """
+    Serve _MOCK_DB to routes in place of a real database session.
+
+    Route tests only add patches for the functions they customize.
+    """
+    from backend.main import app
+    from backend.database import get_db
+
+    _MOCK_DB.reset_mock()
+    app.dependency_overrides[get_db] = lambda: _MOCK_DB
+    try:
+        # Every crawl route renders the stored crawl log
+        with patch("backend.main.get_crawl_logs", return_value=[]):
+            yield _MOCK_DB
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def crawl_state():
+    """Serve the crawl routes a fresh CrawlState through a dependency override."""
+    from backend.main import app
+    from backend.services.crawler import CrawlState, get_crawl_state
+
+    state = CrawlState()
+    app.dependency_overrides[get_crawl_state] = lambda: state
+    yield state
+    app.dependency_overrides.pop(get_crawl_state, None)
 
 
 class TestVerifyDatabase:
@@ -35,344 +72,240 @@ class TestVerifyDatabase:
         db_file = tmp_path / "test.db"
         return db_file
 
+    @pytest.fixture
+    def existing_database_path(self, mock_database_path):
+        """Create an empty stub file so the existence check passes."""
+        mock_database_path.touch()
+        return mock_database_path
+
+    @pytest.fixture
+    def memory_connection(self):
+        """Open a raw in-memory sqlite3 connection for schema setup."""
+        connection = sqlite3.connect(":memory:", check_same_thread=False)
+        yield connection
+        connection.close()
+
+    @pytest.fixture
+    def memory_engine(self, memory_connection):
+        """Wrap the raw in-memory connection in a single-connection engine."""
+        test_engine = create_engine(
+            "sqlite://",
+            creator=lambda: memory_connection,
+            poolclass=StaticPool,
+        )
+        yield test_engine
+        test_engine.dispose()
+
     def test_logs_error_when_database_missing(self, mock_database_path, caplog):
         """verify_database should log error when database file doesn't exist."""
         import logging
         import backend.main
 
-        caplog.set_level(logging.ERROR)
+        caplog.set_level(logging.ERROR, logger="backend.main")
 
         # Patch DATABASE_PATH to use our temp path (file doesn't exist)
         with patch.object(backend.main, 'DATABASE_PATH', mock_database_path):
             backend.main.verify_database()
 
-        assert "Database file not found" in caplog.text
-        assert "alembic upgrade head" in caplog.text
-
-    def test_logs_warning_when_alembic_version_missing(self, mock_database_path, caplog):
-        """verify_database should log warning when alembic_version table doesn't exist."""
-        import logging
-        import backend.main
-
-        caplog.set_level(logging.WARNING)
-
-        # Create an empty database file with a dummy table
-        test_engine = create_engine(
-            f"sqlite:///{mock_database_path}",
-            connect_args={"check_same_thread": False}
+        assert any(
+            record.levelno == logging.ERROR
+            and "Database file not found" in record.getMessage()
+            and "alembic upgrade head" in record.getMessage()
+            for record in caplog.records
         )
-        with test_engine.connect() as conn:
-            conn.execute(text("CREATE TABLE dummy (id INTEGER PRIMARY KEY)"))
-            conn.commit()
 
-        with patch.object(backend.main, 'DATABASE_PATH', mock_database_path), \
-             patch.object(backend.main, 'engine', test_engine):
-            backend.main.verify_database()
-
-        test_engine.dispose()
-        assert "Alembic version table not found" in caplog.text
-
-    def test_logs_warning_when_tables_missing(self, mock_database_path, caplog):
-        """verify_database should log warning when application tables are missing."""
+    @pytest.mark.parametrize(
+        "setup_statements, expected_warning",
+        [
+            (
+                # Only a dummy table, no alembic_version
+                [_CREATE_DUMMY_TABLE],
+                "Alembic version table not found",
+            ),
+            (
+                # alembic_version present but no app tables
+                [_CREATE_ALEMBIC_VERSION_TABLE, _INSERT_ALEMBIC_VERSION],
+                "Missing tables",
+            ),
+        ],
+        ids=["alembic_version_missing", "tables_missing"],
+    )
+    def test_logs_warning_for_incomplete_schema(
+        self, existing_database_path, memory_connection, memory_engine, caplog,
+        setup_statements, expected_warning
+    ):
+        """verify_database should log warning when the schema is incomplete."""
         import logging
         import backend.main
 
-        caplog.set_level(logging.WARNING)
+        caplog.set_level(logging.WARNING, logger="backend.main")
 
-        # Create database with alembic_version but no app tables
-        test_engine = create_engine(
-            f"sqlite:///{mock_database_path}",
-            connect_args={"check_same_thread": False}
-        )
-        with test_engine.connect() as conn:
-            conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
-            conn.execute(text("INSERT INTO alembic_version VALUES ('001_initial')"))
-            conn.commit()
+        with memory_connection:
+            for statement in setup_statements:
+                memory_connection.execute(statement)
 
-        with patch.object(backend.main, 'DATABASE_PATH', mock_database_path), \
-             patch.object(backend.main, 'engine', test_engine):
+        with patch.multiple(
+            backend.main, DATABASE_PATH=existing_database_path, engine=memory_engine
+        ):
             backend.main.verify_database()
 
-        test_engine.dispose()
-        assert "Missing tables" in caplog.text
+        assert any(
+            record.levelno == logging.WARNING and expected_warning in record.getMessage()
+            for record in caplog.records
+        )
 
-    def test_succeeds_when_database_complete(self, mock_database_path):
+    def test_succeeds_when_database_complete(
+        self, existing_database_path, memory_connection, memory_engine
+    ):
         """verify_database should complete without warning/error when all tables exist."""
         import backend.main
+        from backend.database.connection import Base
 
-        # Run actual migrations to create complete database
-        alembic_cfg = Config(str(ALEMBIC_INI))
-        alembic_cfg.set_main_option("sqlalchemy.url", f"sqlite:///{mock_database_path}")
-        command.upgrade(alembic_cfg, "head")
-
-        test_engine = create_engine(
-            f"sqlite:///{mock_database_path}",
-            connect_args={"check_same_thread": False}
-        )
+        # Create the schema directly; Alembic itself is covered by test_migrations
+        Base.metadata.create_all(bind=memory_engine)
+        with memory_connection:
+            memory_connection.execute(_CREATE_ALEMBIC_VERSION_TABLE)
 
         # Mock the logger to verify the success message is logged
-        with patch.object(backend.main, 'DATABASE_PATH', mock_database_path), \
-             patch.object(backend.main, 'engine', test_engine), \
-             patch.object(backend.main.logger, 'info') as mock_info, \
-             patch.object(backend.main.logger, 'warning') as mock_warning, \
-             patch.object(backend.main.logger, 'error') as mock_error:
+        with patch.multiple(
+            backend.main, DATABASE_PATH=existing_database_path, engine=memory_engine
+        ), patch.multiple(
+            backend.main.logger, info=DEFAULT, warning=DEFAULT, error=DEFAULT
+        ) as log_mocks:
             backend.main.verify_database()
 
             # Should log success info, no warnings or errors
-            mock_info.assert_called_once()
-            assert "Database verification successful" in mock_info.call_args[0][0]
-            mock_warning.assert_not_called()
-            mock_error.assert_not_called()
-
-        test_engine.dispose()
+            log_mocks["info"].assert_called_once()
+            assert "Database verification successful" in log_mocks["info"].call_args[0][0]
+            log_mocks["warning"].assert_not_called()
+            log_mocks["error"].assert_not_called()
 
-    def test_raises_on_connection_error(self, mock_database_path):
+    def test_raises_on_connection_error(self, existing_database_path):
         """verify_database should raise exception on database connection error."""
         import backend.main
 
-        # Create database file so it passes existence check
-        mock_database_path.touch()
-
         # Create a mock engine that raises on connect
         mock_engine = MagicMock()
         mock_engine.connect.side_effect = Exception("Connection failed")
 
-        with patch.object(backend.main, 'DATABASE_PATH', mock_database_path), \
-             patch.object(backend.main, 'engine', mock_engine):
+        with patch.multiple(
+            backend.main, DATABASE_PATH=existing_database_path, engine=mock_engine
+        ):
             with pytest.raises(Exception, match="Connection failed"):
                 backend.main.verify_database()
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_returns_ok(self):
+    def test_health_returns_ok(self, client):
         """Test /health endpoint returns healthy status."""
-        from backend.main import app
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"):
-
-            mock_db = MagicMock()
-            mock_session.return_value = mock_db
-            client = TestClient(app)
-            response = client.get("/health")
+        response = client.get("/health")
 
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestDashboardRoute:
     """Tests for dashboard route."""
 
-    def test_dashboard_returns_html(self):
+    def test_dashboard_returns_html(self, client):
         """Test dashboard returns HTML response."""
-        from backend.main import app
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_all_search_terms") as mock_terms, \
-             patch("backend.main.get_matches_by_search_term") as mock_matches, \
-             patch("backend.main.mark_matches_as_seen"):
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_terms.return_value = []
-            mock_matches.return_value = []
-
-            client = TestClient(app)
+        with patch.multiple(
+            "backend.main",
+            get_all_sources=Mock(return_value=[]),
+            get_all_search_terms=Mock(return_value=[]),
+            get_active_exclude_terms=Mock(return_value=[]),
+            get_matches_grouped_by_search_term=Mock(return_value={}),
+            mark_matches_as_seen=DEFAULT,
+        ):
             response = client.get("/")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestAdminSearchTermsRoute:
     """Tests for admin search terms route."""
 
-    def test_admin_search_terms_returns_html(self):
+    def test_admin_search_terms_returns_html(self, client):
         """Test admin search terms page returns HTML."""
-        from backend.main import app
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_all_search_terms") as mock_terms:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_terms.return_value = []
-
-            client = TestClient(app)
+        with patch("backend.main.get_all_search_terms", return_value=[]):
             response = client.get("/admin/search-terms")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestAdminSourcesRoute:
     """Tests for admin sources route."""
 
-    def test_admin_sources_returns_html(self):
+    def test_admin_sources_returns_html(self, client):
         """Test admin sources page returns HTML."""
-        from backend.main import app
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_all_sources_sorted") as mock_sources:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_sources.return_value = []
-
-            client = TestClient(app)
+        with patch("backend.main.get_all_sources_sorted", return_value=[]):
             response = client.get("/admin/sources")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestAdminCrawlRoute:
     """Tests for admin crawl status route."""
 
-    def test_admin_crawl_status_returns_html(self):
+    def test_admin_crawl_status_returns_html(self, client, crawl_state):
         """Test admin crawl status page returns HTML."""
-        from backend.main import app
-        from backend.services.crawler import CrawlState
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_crawl_state") as mock_state, \
-             patch("backend.main.get_crawl_log") as mock_log:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_state.return_value = CrawlState()
-            mock_log.return_value = []
-
-            client = TestClient(app)
-            response = client.get("/admin/crawl")
+        response = client.get("/admin/crawl")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestAdminExcludeTermsRoute:
     """Tests for admin exclude terms route."""
 
-    def test_admin_exclude_terms_returns_html(self):
+    def test_admin_exclude_terms_returns_html(self, client):
         """Test admin exclude terms page returns HTML."""
-        from backend.main import app
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_all_exclude_terms_sorted") as mock_terms:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_terms.return_value = []
-
-            client = TestClient(app)
+        with patch("backend.main.get_all_exclude_terms_sorted", return_value=[]):
             response = client.get("/admin/exclude-terms")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestCrawlStatusPolling:
     """Tests for crawl status polling endpoint."""
 
-    def test_crawl_status_partial_returns_html(self):
+    def test_crawl_status_partial_returns_html(self, client, crawl_state):
         """Test crawl status partial returns HTML."""
-        from backend.main import app
-        from backend.services.crawler import CrawlState
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.get_crawl_state") as mock_state, \
-             patch("backend.main.get_crawl_log") as mock_log:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_state.return_value = CrawlState()
-            mock_log.return_value = []
-
-            client = TestClient(app)
-            response = client.get("/admin/crawl/status")
+        response = client.get("/admin/crawl/status")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
 
+@pytest.mark.usefixtures("app_mocks")
 class TestCancelCrawl:
     """Tests for cancel crawl endpoint."""
 
-    def test_cancel_crawl_when_not_running(self):
+    def test_cancel_crawl_when_not_running(self, client, crawl_state):
         """Test cancel crawl returns error when not running."""
-        from backend.main import app
-        from backend.services.crawler import CrawlState
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.is_crawl_running") as mock_running, \
-             patch("backend.main.get_crawl_state") as mock_state:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_running.return_value = False
-            mock_state.return_value = CrawlState()
-
-            client = TestClient(app)
-            response = client.post("/admin/crawl/cancel")
+        response = client.post("/admin/crawl/cancel")
 
         assert response.status_code == 200
+        assert crawl_state.cancel_requested is False
 
-    def test_cancel_crawl_when_running(self):
+    def test_cancel_crawl_when_running(self, client, crawl_state):
         """Test cancel crawl requests cancellation when running."""
-        from backend.main import app
-        from backend.services.crawler import CrawlState
-
-        with patch("backend.main.verify_database"), \
-             patch("backend.database.SessionLocal") as mock_session_class, \
-             patch("backend.main.ensure_sources_exist"), \
-             patch("backend.database.ensure_default_search_terms"), \
-             patch("backend.database.ensure_default_exclude_terms"), \
-             patch("backend.main.is_crawl_running") as mock_running, \
-             patch("backend.main.request_crawl_cancel") as mock_cancel, \
-             patch("backend.main.get_crawl_state") as mock_state:
-
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-            mock_running.return_value = True
-            state = CrawlState(is_running=True)
-            mock_state.return_value = state
-
-            client = TestClient(app)
-            response = client.post("/admin/crawl/cancel")
+        crawl_state.is_running = True
 
-            mock_cancel.assert_called_once()
+        response = client.post("/admin/crawl/cancel")
 
         assert response.status_code == 200
+        assert crawl_state.cancel_requested is True
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for route tests.
+
+Route tests that opt in via ``pytest.mark.usefixtures("db_session")`` run
+against an in-memory SQLite database instead of data/yoga_helper.db.
+"""
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.pool import StaticPool
+
+from backend.main import app
+from backend.database import get_db
+from tests.conftest import create_savepoint_engine, savepoint_sessions
+
+
+def pytest_configure(config):
+    """Register xdist_group so the mark is known even without pytest-xdist."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run the marked tests on a single xdist worker "
+        "(with --dist loadgroup)",
+    )
+
+
+@pytest.fixture(scope="session")
+def memory_engine():
+    """
+    Create an in-memory SQLite engine with the full schema.
+
+    StaticPool hands out one shared connection, so the schema created here
+    lives for the whole session and every session sees the same database.
+    The database belongs to the process, so each pytest-xdist worker gets
+    its own copy.
+    """
+    engine = create_savepoint_engine("sqlite://", poolclass=StaticPool)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(memory_engine):
+    """
+    Provide a session whose changes are rolled back after each test.
+
+    Routes get the same session through a get_db override, so they see the
+    test data. See savepoint_sessions for how commits are contained.
+    """
+    with savepoint_sessions(memory_engine, autoflush=False) as factory:
+        session = factory()
+        app.dependency_overrides[get_db] = lambda: session
+        try:
+            yield session
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            session.close()
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """
+    Create an async client that calls the app directly on the test's loop.
+
+    Unlike TestClient there is no portal thread per request and lifespan
+    startup is not run, so no startup seeding has to be patched out.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
@@ -5,47 +5,70 @@ Tests the crawl control functionality:
 - 6.1: Manual crawl trigger
 - 6.2: Display crawl status
 """
-from unittest.mock import patch, AsyncMock
+from datetime import datetime, timezone
+from unittest.mock import DEFAULT, patch, AsyncMock
 import pytest
+from bs4 import BeautifulSoup
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from backend.main import app
-from backend.database import SessionLocal, Base, engine
+from backend.database import get_db
 from backend.database.models import Source, SearchTerm
-from backend.services.crawler import CrawlResult, CrawlState, _crawl_state
+from backend.services import crawler
+from backend.services.crawler import (
+    CrawlResult,
+    CrawlState,
+    get_crawl_state,
+    get_last_crawl_result,
+    is_crawl_running,
+)
+from tests.helpers import assert_all_in
+
+# Fixed timestamp for crawl results and progress, keeps rendered pages stable
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# Non-ASCII needles, encoded once for checks against response.content
+NO_CRAWL_YET = "Kein Crawl durchgeführt".encode("utf-8")
+ALREADY_RUNNING = "läuft bereits".encode("utf-8")
+RUNNING = "Läuft".encode("utf-8")
+RUNNING_LOWER = "läuft".encode("utf-8")
+
+
+def _stat(soup, testid):
+    """Return the text of the last-crawl statistic with the given data-testid."""
+    return soup.select_one(f'[data-testid="{testid}"]').get_text(strip=True)
+
+
+@pytest.fixture(scope="module")
+def lifespan_client():
+    """
+    Create one test client, and run app startup once, for the module.
+
+    Startup seeding is patched out so the tests start from an empty database.
+    The crawler is stubbed too: the client keeps its event loop alive across
+    tests, so a background crawl may outlive the test that started it.
+    """
+    with patch.multiple(
+        "backend.main",
+        verify_database=DEFAULT,
+        ensure_sources_exist=DEFAULT,
+        run_crawl_async=DEFAULT,
+    ), patch.multiple(
+        "backend.database",
+        ensure_default_search_terms=DEFAULT,
+        ensure_default_exclude_terms=DEFAULT,
+    ), TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def db_session():
-    """Create a fresh database session for each test."""
-    Base.metadata.create_all(bind=engine)
-
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
-
-
-@pytest.fixture
-def reset_crawl_state():
-    """Reset global crawl state before and after each test."""
-    global _crawl_state
-    _crawl_state.is_running = False
-    _crawl_state.current_source = None
-    _crawl_state.last_result = None
-    yield
-    _crawl_state.is_running = False
-    _crawl_state.current_source = None
-    _crawl_state.last_result = None
+def crawl_state():
+    """Serve the crawl routes a fresh CrawlState that the test can modify."""
+    state = CrawlState()
+    app.dependency_overrides[get_crawl_state] = lambda: state
+    yield state
+    app.dependency_overrides.pop(get_crawl_state, None)
 
 
 @pytest.fixture
@@ -55,8 +78,7 @@ def sample_sources(db_session):
         Source(name="waffenboerse.ch", base_url="https://www.waffenboerse.ch", is_active=True),
         Source(name="waffengebraucht.ch", base_url="https://waffengebraucht.ch", is_active=True),
     ]
-    for source in sources:
-        db_session.add(source)
+    db_session.add_all(sources)
     db_session.commit()
     return sources
 
@@ -67,56 +89,66 @@ def sample_search_terms(db_session):
     terms = [
         SearchTerm(term="Glock", match_type="exact", is_active=True),
     ]
-    for term in terms:
-        db_session.add(term)
+    db_session.add_all(terms)
     db_session.commit()
     return terms
 
 
+@pytest.fixture(scope="class")
+def idle_crawl_page(lifespan_client, memory_engine):
+    """
+    Fetch /admin/crawl once per class with no crawl running or recorded.
+
+    Function-scoped db_session and crawl_state can't back a class-scoped
+    fixture, so the overrides are installed here for the one request.
+    """
+    session = Session(bind=memory_engine)
+    app.dependency_overrides[get_db] = lambda: session
+    app.dependency_overrides[get_crawl_state] = lambda: CrawlState()
+    try:
+        return lifespan_client.get("/admin/crawl")
+    finally:
+        app.dependency_overrides.pop(get_crawl_state, None)
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+
+
 class TestCrawlStatusPage:
     """Tests for Story 6.2: Display Crawl Status (FR17)."""
 
-    def test_crawl_page_returns_200(self, client, reset_crawl_state):
+    def test_crawl_page_returns_200(self, idle_crawl_page):
         """Test that crawl page returns 200 status."""
-        response = client.get("/admin/crawl")
-        assert response.status_code == 200
+        assert idle_crawl_page.status_code == 200
 
-    def test_crawl_page_is_html(self, client, reset_crawl_state):
+    def test_crawl_page_is_html(self, idle_crawl_page):
         """Test that crawl page returns HTML."""
-        response = client.get("/admin/crawl")
-        assert "text/html" in response.headers["content-type"]
+        assert "text/html" in idle_crawl_page.headers["content-type"]
 
-    def test_crawl_page_has_title(self, client, reset_crawl_state):
+    def test_crawl_page_has_title(self, idle_crawl_page):
         """Test that crawl page has correct title."""
-        response = client.get("/admin/crawl")
-        assert "Crawl-Status" in response.text
+        assert b"Crawl-Status" in idle_crawl_page.content
 
-    def test_crawl_button_shown_when_idle(self, client, reset_crawl_state):
+    def test_crawl_button_shown_when_idle(self, idle_crawl_page):
         """Test that crawl button is shown when no crawl is running."""
-        response = client.get("/admin/crawl")
-        assert "Jetzt crawlen" in response.text
+        assert b"Jetzt crawlen" in idle_crawl_page.content
 
-    def test_no_previous_crawl_message(self, client, reset_crawl_state):
+    def test_no_previous_crawl_message(self, idle_crawl_page):
         """Test that message is shown when no crawl has been done."""
-        response = client.get("/admin/crawl")
-        assert "Kein Crawl durchgeführt" in response.text
+        assert NO_CRAWL_YET in idle_crawl_page.content
 
-    def test_ready_status_shown_when_idle(self, client, reset_crawl_state):
+    def test_ready_status_shown_when_idle(self, idle_crawl_page):
         """Test that 'Bereit' status is shown when idle."""
-        response = client.get("/admin/crawl")
-        assert "Bereit" in response.text
+        assert b"Bereit" in idle_crawl_page.content
 
 
+@pytest.mark.usefixtures("db_session", "crawl_state")
 class TestCrawlStatusWithLastResult:
     """Tests for displaying last crawl result."""
 
-    def test_last_result_shown(self, client, reset_crawl_state):
+    def test_last_result_shown(self, lifespan_client, crawl_state):
         """Test that last crawl result is displayed."""
-        from datetime import datetime, timezone
-        from backend.services import crawler
-
         # Set up a last result
-        crawler._crawl_state.last_result = CrawlResult(
+        crawl_state.last_result = CrawlResult(
             sources_attempted=3,
             sources_succeeded=2,
             sources_failed=1,
@@ -125,106 +157,91 @@ class TestCrawlStatusWithLastResult:
             duplicate_matches=5,
             failed_sources=["test.ch"],
             duration_seconds=15.5,
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
 
-        response = client.get("/admin/crawl")
+        response = lifespan_client.get("/admin/crawl")
 
-        # Should show statistics
-        assert "3" in response.text  # sources_attempted
-        assert "2" in response.text  # sources_succeeded
-        assert "50" in response.text  # total_listings
-        assert "10" in response.text  # new_matches
+        # Read each statistic from its own element; bare digits would also
+        # match timestamps elsewhere on the page
+        soup = BeautifulSoup(response.text, "lxml")
+        assert _stat(soup, "sources-attempted") == "3"
+        assert _stat(soup, "sources-succeeded") == "2"
+        assert _stat(soup, "total-listings") == "50"
+        assert _stat(soup, "new-matches") == "10"
 
-    def test_success_status_shown(self, client, reset_crawl_state):
+    def test_success_status_shown(self, lifespan_client, crawl_state):
         """Test that success status is shown for successful crawl."""
-        from datetime import datetime, timezone
-        from backend.services import crawler
-
-        crawler._crawl_state.last_result = CrawlResult(
+        crawl_state.last_result = CrawlResult(
             sources_attempted=2,
             sources_succeeded=2,
             sources_failed=0,
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
 
-        response = client.get("/admin/crawl")
-        assert "Erfolgreich" in response.text
+        response = lifespan_client.get("/admin/crawl")
+        assert b"Erfolgreich" in response.content
 
-    def test_partial_success_status_shown(self, client, reset_crawl_state):
+    def test_partial_success_status_shown(self, lifespan_client, crawl_state):
         """Test that partial success status is shown."""
-        from datetime import datetime, timezone
-        from backend.services import crawler
-
-        crawler._crawl_state.last_result = CrawlResult(
+        crawl_state.last_result = CrawlResult(
             sources_attempted=3,
             sources_succeeded=2,
             sources_failed=1,
             failed_sources=["test.ch"],
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
 
-        response = client.get("/admin/crawl")
-        assert "Teilweise erfolgreich" in response.text
+        response = lifespan_client.get("/admin/crawl")
+        assert b"Teilweise erfolgreich" in response.content
 
-    def test_failed_sources_listed(self, client, reset_crawl_state):
+    def test_failed_sources_listed(self, lifespan_client, crawl_state):
         """Test that failed sources are listed."""
-        from datetime import datetime, timezone
-        from backend.services import crawler
-
-        crawler._crawl_state.last_result = CrawlResult(
+        crawl_state.last_result = CrawlResult(
             sources_attempted=2,
             sources_succeeded=1,
             sources_failed=1,
             failed_sources=["problematic.ch"],
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
 
-        response = client.get("/admin/crawl")
-        assert "problematic.ch" in response.text
+        response = lifespan_client.get("/admin/crawl")
+        assert b"problematic.ch" in response.content
 
 
+@pytest.mark.usefixtures("db_session", "crawl_state")
+@pytest.mark.xdist_group("crawl_state")
 class TestManualCrawlTrigger:
     """Tests for Story 6.1: Manual Crawl Trigger (FR16)."""
 
-    def test_crawl_button_disabled_when_running(self, client, reset_crawl_state):
+    def test_crawl_button_disabled_when_running(self, lifespan_client, crawl_state):
         """Test that button is disabled when crawl is running."""
-        from backend.services import crawler
-
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "waffenboerse.ch"
+        crawl_state.is_running = True
+        crawl_state.current_source = "waffenboerse.ch"
 
-        response = client.get("/admin/crawl")
+        response = lifespan_client.get("/admin/crawl")
 
-        assert "Läuft..." in response.text
-        assert "disabled" in response.text
+        assert_all_in(response.text, ["Läuft...", "disabled"])
 
-    def test_current_source_shown_when_running(self, client, reset_crawl_state):
+    def test_current_source_shown_when_running(self, lifespan_client, crawl_state):
         """Test that current source is shown when crawl is running."""
-        from backend.services import crawler
+        crawl_state.is_running = True
+        crawl_state.current_source = "waffenboerse.ch"
 
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "waffenboerse.ch"
+        response = lifespan_client.get("/admin/crawl")
+        assert b"waffenboerse.ch" in response.content
 
-        response = client.get("/admin/crawl")
-        assert "waffenboerse.ch" in response.text
-
-    def test_start_crawl_rejected_without_search_terms(self, client, reset_crawl_state, db_session):
+    @patch("backend.main.get_active_search_terms", return_value=[])
+    def test_start_crawl_rejected_without_search_terms(self, mock_terms, lifespan_client):
         """Test that starting crawl is rejected when no search terms exist."""
-        # Ensure no search terms exist
-        db_session.query(SearchTerm).delete()
-        db_session.commit()
-
-        response = client.post("/admin/crawl/start")
+        response = lifespan_client.post("/admin/crawl/start")
 
         assert response.status_code == 200
-        assert "Suchbegriffe" in response.text
+        assert b"Suchbegriffe" in response.content
 
     @patch("backend.main.run_crawl_async")
-    def test_start_crawl_success(self, mock_crawl, client, reset_crawl_state, sample_search_terms):
+    def test_start_crawl_success(self, mock_crawl, lifespan_client, sample_search_terms):
         """Test successfully starting a crawl."""
-        from datetime import datetime, timezone
-
         mock_result = CrawlResult(
             sources_attempted=2,
             sources_succeeded=2,
@@ -233,20 +250,20 @@ class TestManualCrawlTrigger:
             new_matches=5,
             duplicate_matches=3,
             duration_seconds=10.0,
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
         mock_crawl.return_value = mock_result
 
-        response = client.post("/admin/crawl/start")
+        response = lifespan_client.post("/admin/crawl/start")
 
         assert response.status_code == 200
         assert "erfolgreich" in response.text.lower()
 
     @patch("backend.main.run_crawl_async")
-    def test_start_crawl_shows_results(self, mock_crawl, client, reset_crawl_state, sample_search_terms):
+    def test_start_crawl_shows_results(
+        self, mock_crawl, lifespan_client, sample_search_terms, crawl_state
+    ):
         """Test that crawl results are shown after completion."""
-        from datetime import datetime, timezone
-
         mock_result = CrawlResult(
             sources_attempted=3,
             sources_succeeded=3,
@@ -255,223 +272,223 @@ class TestManualCrawlTrigger:
             new_matches=25,
             duplicate_matches=10,
             duration_seconds=30.0,
-            completed_at=datetime.now(timezone.utc),
+            completed_at=NOW,
         )
-        mock_crawl.return_value = mock_result
 
-        response = client.post("/admin/crawl/start")
+        def finish_crawl(*args, **kwargs):
+            # Record the result and finish, like run_crawl_async
+            crawl_state.last_result = mock_result
+            crawl_state.is_running = False
+            return mock_result
 
-        assert "100" in response.text  # total_listings
-        assert "25" in response.text   # new_matches
+        mock_crawl.side_effect = finish_crawl
 
-    def test_start_crawl_rejected_when_running(self, client, reset_crawl_state, sample_search_terms):
-        """Test that starting crawl is rejected when already running."""
-        from backend.services import crawler
+        lifespan_client.post("/admin/crawl/start")
+        response = lifespan_client.get("/admin/crawl/status")
 
-        crawler._crawl_state.is_running = True
+        soup = BeautifulSoup(response.text, "lxml")
+        assert _stat(soup, "total-listings") == "100"
+        assert _stat(soup, "new-matches") == "25"
 
-        response = client.post("/admin/crawl/start")
+    def test_start_crawl_rejected_when_running(
+        self, lifespan_client, sample_search_terms, crawl_state
+    ):
+        """Test that starting crawl is rejected when already running."""
+        crawl_state.is_running = True
+
+        response = lifespan_client.post("/admin/crawl/start")
 
         assert response.status_code == 200
-        assert "läuft bereits" in response.text
+        assert ALREADY_RUNNING in response.content
 
     @patch("backend.main.run_crawl_async")
-    def test_start_crawl_handles_error(self, mock_crawl, client, reset_crawl_state, sample_search_terms):
+    def test_start_crawl_handles_error(self, mock_crawl, lifespan_client, sample_search_terms):
         """Test that errors during crawl are handled gracefully."""
         mock_crawl.side_effect = Exception("Test error")
 
-        response = client.post("/admin/crawl/start")
+        response = lifespan_client.post("/admin/crawl/start")
 
         assert response.status_code == 200
         assert "fehlgeschlagen" in response.text.lower()
 
 
+@pytest.mark.usefixtures("db_session", "crawl_state")
 class TestCrawlStatusPolling:
     """Tests for HTMX status polling endpoint."""
 
-    def test_status_endpoint_returns_partial(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_status_endpoint_returns_partial(self, async_client):
         """Test that status endpoint returns partial HTML."""
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    def test_status_endpoint_shows_running_state(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_status_endpoint_shows_running_state(self, async_client, crawl_state):
         """Test that status endpoint shows running state."""
-        from backend.services import crawler
-
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
 
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
-        assert "Läuft" in response.text or "läuft" in response.text
-        assert "test.ch" in response.text
+        assert RUNNING in response.content or RUNNING_LOWER in response.content
+        assert b"test.ch" in response.content
 
 
+@pytest.mark.usefixtures("db_session", "crawl_state")
 class TestCrawlProgressDisplay:
     """Tests for crawl progress indicator display."""
 
-    def test_progress_bar_shown_when_running(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_progress_bar_shown_when_running(self, async_client, crawl_state):
         """Test that progress bar is shown when crawl is running with progress data."""
-        from backend.services import crawler
-        from datetime import datetime, timezone
-
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
-        crawler._crawl_state.sources_total = 10
-        crawler._crawl_state.sources_done = 3
-        crawler._crawl_state.started_at = datetime.now(timezone.utc)
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
+        crawl_state.sources_total = 10
+        crawl_state.sources_done = 3
+        crawl_state.started_at = NOW
 
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # Should show progress text "X von Y Quellen"
-        assert "3 von 10 Quellen" in response.text
+        assert b"3 von 10 Quellen" in response.content
 
-    def test_progress_percentage_calculated(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_progress_percentage_calculated(self, async_client, crawl_state):
         """Test that progress percentage is shown in the progress bar."""
-        from backend.services import crawler
-        from datetime import datetime, timezone
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
+        crawl_state.sources_total = 4
+        crawl_state.sources_done = 2
+        crawl_state.started_at = NOW
 
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
-        crawler._crawl_state.sources_total = 4
-        crawler._crawl_state.sources_done = 2
-        crawler._crawl_state.started_at = datetime.now(timezone.utc)
-
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # 2/4 = 50%, should have style="width: 50%"
-        assert "width: 50%" in response.text
+        assert b"width: 50%" in response.content
 
-    def test_no_progress_when_sources_total_zero(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_no_progress_when_sources_total_zero(self, async_client, crawl_state):
         """Test that progress bar is not shown when sources_total is 0."""
-        from backend.services import crawler
-
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
-        crawler._crawl_state.sources_total = 0
-        crawler._crawl_state.sources_done = 0
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
+        crawl_state.sources_total = 0
+        crawl_state.sources_done = 0
 
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # Should not show "von" "Quellen" progress text when no sources
-        assert "von 0 Quellen" not in response.text
+        assert b"von 0 Quellen" not in response.content
 
-    def test_eta_display_element_present(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_eta_display_element_present(self, async_client, crawl_state):
         """Test that ETA display element is present when crawl is running."""
-        from backend.services import crawler
-        from datetime import datetime, timezone
-
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
-        crawler._crawl_state.sources_total = 10
-        crawler._crawl_state.sources_done = 5
-        crawler._crawl_state.started_at = datetime.now(timezone.utc)
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
+        crawl_state.sources_total = 10
+        crawl_state.sources_done = 5
+        crawl_state.started_at = NOW
 
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # ETA display element should be present
-        assert 'id="eta-display"' in response.text
+        assert b'id="eta-display"' in response.content
 
-    def test_started_at_passed_to_template(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_started_at_passed_to_template(self, async_client, crawl_state):
         """Test that started_at timestamp is passed to template for ETA calculation."""
-        from backend.services import crawler
-        from datetime import datetime, timezone
+        crawl_state.is_running = True
+        crawl_state.current_source = "test.ch"
+        crawl_state.sources_total = 10
+        crawl_state.sources_done = 3
+        crawl_state.started_at = NOW
 
-        test_time = datetime.now(timezone.utc)
-        crawler._crawl_state.is_running = True
-        crawler._crawl_state.current_source = "test.ch"
-        crawler._crawl_state.sources_total = 10
-        crawler._crawl_state.sources_done = 3
-        crawler._crawl_state.started_at = test_time
-
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # The started_at should be in the response for JavaScript ETA calculation
-        assert "startedAt" in response.text
+        assert b"startedAt" in response.content
 
-    def test_no_progress_when_not_running(self, client, reset_crawl_state):
+    @pytest.mark.asyncio
+    async def test_no_progress_when_not_running(self, async_client):
         """Test that progress bar is not shown when crawl is not running."""
-        response = client.get("/admin/crawl/status")
+        response = await async_client.get("/admin/crawl/status")
 
         # Should show "Bereit" status, not progress bar
-        assert "Bereit" in response.text
+        assert b"Bereit" in response.content
         # Should not have progress-specific elements
-        assert "von" not in response.text or "Quellen" not in response.text
+        assert b"von" not in response.content or b"Quellen" not in response.content
 
 
 class TestCrawlStateHelpers:
     """Tests for crawl state helper functions."""
 
-    def test_is_crawl_running(self, reset_crawl_state):
-        """Test is_crawl_running function."""
-        from backend.services.crawler import is_crawl_running
-        from backend.services import crawler
+    @pytest.fixture
+    def global_state(self, monkeypatch):
+        """Swap the module-level crawl state for a fresh one during the test."""
+        state = CrawlState()
+        monkeypatch.setattr(crawler, "_crawl_state", state)
+        return state
 
-        assert is_crawl_running() is False
+    def test_is_crawl_running(self, crawl_state):
+        """Test is_crawl_running function."""
+        assert is_crawl_running(crawl_state) is False
 
-        crawler._crawl_state.is_running = True
-        assert is_crawl_running() is True
+        crawl_state.is_running = True
+        assert is_crawl_running(crawl_state) is True
 
-    def test_get_last_crawl_result(self, reset_crawl_state):
+    def test_get_last_crawl_result(self, global_state):
         """Test get_last_crawl_result function."""
-        from backend.services.crawler import get_last_crawl_result
-        from backend.services import crawler
-
         assert get_last_crawl_result() is None
 
         result = CrawlResult(sources_attempted=1)
-        crawler._crawl_state.last_result = result
+        global_state.last_result = result
 
         assert get_last_crawl_result() == result
 
-    def test_get_crawl_state(self, reset_crawl_state):
+    def test_get_crawl_state(self, global_state):
         """Test get_crawl_state function."""
-        from backend.services.crawler import get_crawl_state
-
         state = get_crawl_state()
 
-        assert isinstance(state, CrawlState)
+        assert state is global_state
         assert state.is_running is False
 
 
 class TestCrawlResultProperties:
     """Tests for CrawlResult dataclass properties."""
 
-    def test_is_success(self):
+    @pytest.mark.parametrize("attempted,succeeded,failed,expected", [
+        (2, 2, 0, True),
+        (2, 1, 1, False),
+    ])
+    def test_is_success(self, attempted, succeeded, failed, expected):
         """Test is_success property."""
-        result = CrawlResult(sources_attempted=2, sources_succeeded=2, sources_failed=0)
-        assert result.is_success is True
-
-        result = CrawlResult(sources_attempted=2, sources_succeeded=1, sources_failed=1)
-        assert result.is_success is False
-
-    def test_is_partial_success(self):
+        result = CrawlResult(
+            sources_attempted=attempted, sources_succeeded=succeeded, sources_failed=failed
+        )
+        assert result.is_success is expected
+
+    @pytest.mark.parametrize("attempted,succeeded,failed,expected", [
+        (3, 2, 1, True),
+        (2, 2, 0, False),
+        (2, 0, 2, False),
+    ])
+    def test_is_partial_success(self, attempted, succeeded, failed, expected):
         """Test is_partial_success property."""
-        result = CrawlResult(sources_attempted=3, sources_succeeded=2, sources_failed=1)
-        assert result.is_partial_success is True
-
-        result = CrawlResult(sources_attempted=2, sources_succeeded=2, sources_failed=0)
-        assert result.is_partial_success is False
-
-        result = CrawlResult(sources_attempted=2, sources_succeeded=0, sources_failed=2)
-        assert result.is_partial_success is False
-
-    def test_status_text(self):
+        result = CrawlResult(
+            sources_attempted=attempted, sources_succeeded=succeeded, sources_failed=failed
+        )
+        assert result.is_partial_success is expected
+
+    @pytest.mark.parametrize("attempted,succeeded,failed,expected", [
+        (2, 2, 0, "Erfolgreich"),
+        (3, 2, 1, "Teilweise erfolgreich"),
+        (2, 0, 2, "Fehlgeschlagen"),
+        (0, 0, 0, "Keine Quellen"),
+    ], ids=["success", "partial", "failure", "no_sources"])
+    def test_status_text(self, attempted, succeeded, failed, expected):
         """Test status_text property."""
-        # Success
-        result = CrawlResult(sources_attempted=2, sources_succeeded=2, sources_failed=0)
-        assert result.status_text == "Erfolgreich"
-
-        # Partial success
-        result = CrawlResult(sources_attempted=3, sources_succeeded=2, sources_failed=1)
-        assert result.status_text == "Teilweise erfolgreich"
-
-        # Complete failure
-        result = CrawlResult(sources_attempted=2, sources_succeeded=0, sources_failed=2)
-        assert result.status_text == "Fehlgeschlagen"
-
-        # No sources
-        result = CrawlResult(sources_attempted=0, sources_succeeded=0, sources_failed=0)
-        assert result.status_text == "Keine Quellen"
+        result = CrawlResult(
+            sources_attempted=attempted, sources_succeeded=succeeded, sources_failed=failed
+        )
+        assert result.status_text == expected
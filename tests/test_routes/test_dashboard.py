@@ -6,60 +6,46 @@ Tests the dashboard page display:
 - Dashboard with no matches (empty state)
 - Match count display
 """
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from fastapi.testclient import TestClient
 
-from backend.main import app
-from backend.database import SessionLocal, Base, engine
 from backend.database.models import Match, SearchTerm, Source
+from tests.helpers import assert_all_in
 
+# Instant the dashboard clock is pinned to by the frozen_time fixture
+FROZEN_NOW = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
 
-@pytest.fixture
-def db_session():
-    """Create a fresh database session for each test."""
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        # Clean up tables after test
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW.astimezone(tz) if tz else FROZEN_NOW.replace(tzinfo=None)
 
 
 @pytest.fixture
 def sample_data(db_session):
     """Create sample data for testing."""
-    # Create source
     source = Source(
         name="waffenboerse.ch",
         base_url="https://waffenboerse.ch",
         is_active=True,
     )
-    db_session.add(source)
-
-    # Create search term
     term = SearchTerm(
         term="Glock 17",
         match_type="exact",
         is_active=True,
     )
-    db_session.add(term)
-    db_session.commit()
+    db_session.add_all([source, term])
+    # Flush (not commit) to get the ids for the matches
+    db_session.flush()
 
-    # Create matches
-    matches = []
-    for i in range(3):
-        match = Match(
+    matches = [
+        Match(
             source_id=source.id,
             search_term_id=term.id,
             title=f"Glock 17 Gen {i + 4}",
@@ -68,9 +54,9 @@ def sample_data(db_session):
             image_url=f"https://waffenboerse.ch/img{i}.jpg",
             is_new=(i == 0),  # First one is new
         )
-        matches.append(match)
-        db_session.add(match)
-
+        for i in range(3)
+    ]
+    db_session.add_all(matches)
     db_session.commit()
 
     return {
@@ -80,6 +66,22 @@ def sample_data(db_session):
     }
 
 
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin the dashboard's clock to FROZEN_NOW."""
+    monkeypatch.setattr("backend.main.datetime", FrozenDatetime)
+
+
+@pytest.fixture
+def recent_matches(sample_data, db_session):
+    """Backdate the sample matches to two days before FROZEN_NOW."""
+    for match in sample_data["matches"]:
+        match.created_at = (FROZEN_NOW - timedelta(days=2)).replace(tzinfo=None)
+    db_session.commit()
+    return sample_data["matches"]
+
+
+@pytest.mark.usefixtures("db_session")
 class TestDashboardRoute:
     """Tests for dashboard route."""
 
@@ -96,10 +98,10 @@ class TestDashboardRoute:
     def test_dashboard_has_title(self, client):
         """Test that dashboard has correct title."""
         response = client.get("/")
-        assert "Home" in response.text
-        assert "Gilbert's Yoga Helper" in response.text
+        assert_all_in(response.text, ["Home", "Gilbert's Yoga Helper"])
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDashboardEmptyState:
     """Tests for dashboard empty state (AC: 2)."""
 
@@ -108,15 +110,15 @@ class TestDashboardEmptyState:
         response = client.get("/")
 
         # Should show empty state message for no search terms
-        assert "Keine Suchbegriffe" in response.text
-        assert "Suchbegriffe verwalten" in response.text
+        assert_all_in(response.text, ["Keine Suchbegriffe", "Suchbegriffe verwalten"])
 
     def test_empty_state_has_search_terms_link(self, client):
         """Test that empty state has link to search terms page."""
         response = client.get("/")
-        assert '/admin/search-terms' in response.text
+        assert b'/admin/search-terms' in response.content
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDashboardWithMatches:
     """Tests for dashboard with matches (AC: 1)."""
 
@@ -125,52 +127,49 @@ class TestDashboardWithMatches:
         response = client.get("/")
 
         # Should show matches
-        assert "Glock 17 Gen 4" in response.text
-        assert "Glock 17 Gen 5" in response.text
-        assert "Glock 17 Gen 6" in response.text
+        assert_all_in(response.text, ["Glock 17 Gen 4", "Glock 17 Gen 5", "Glock 17 Gen 6"])
 
     def test_match_count_displayed(self, client, sample_data):
         """Test that match count is displayed."""
         response = client.get("/")
 
         # Should show count in header and in group
-        assert "3 Treffer" in response.text
+        assert b"3 Treffer" in response.content
 
     def test_new_match_count_displayed(self, client, sample_data):
         """Test that new match count is displayed."""
         response = client.get("/")
 
         # Should show new count (1 match is marked as new)
-        assert "1 neue" in response.text
+        assert b"1 neue" in response.content
 
     def test_no_empty_state_when_matches_exist(self, client, sample_data):
         """Test that empty state is not shown when search terms exist."""
         response = client.get("/")
 
         # Should NOT show empty state for no search terms
-        assert "Keine Suchbegriffe" not in response.text
+        assert b"Keine Suchbegriffe" not in response.content
 
     def test_match_prices_displayed(self, client, sample_data):
         """Test that match prices are displayed."""
         response = client.get("/")
 
         # Should show prices
-        assert "CHF 800" in response.text
-        assert "CHF 900" in response.text
-        assert "CHF 1000" in response.text
+        assert_all_in(response.text, ["CHF 800", "CHF 900", "CHF 1000"])
 
     def test_source_name_displayed(self, client, sample_data):
         """Test that source name is displayed."""
         response = client.get("/")
-        assert "waffenboerse.ch" in response.text
+        assert b"waffenboerse.ch" in response.content
 
     def test_search_term_displayed_as_group_header(self, client, sample_data):
         """Test that search term is displayed as group header."""
         response = client.get("/")
         # Search term should appear as group header
-        assert "Glock 17" in response.text
+        assert b"Glock 17" in response.content
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDashboardGrouping:
     """Tests for match grouping by search term (Story 3.4)."""
 
@@ -195,12 +194,8 @@ class TestDashboardGrouping:
 
         response = client.get("/")
 
-        # Both group headers should be visible
-        assert "Glock" in response.text
-        assert "SIG" in response.text
-        # Matches should be displayed
-        assert "Glock 17" in response.text
-        assert "SIG P226" in response.text
+        # Both group headers and their matches should be visible
+        assert_all_in(response.text, ["Glock", "SIG", "Glock 17", "SIG P226"])
 
     def test_empty_group_shows_message(self, client, db_session):
         """Test that groups with no matches show empty message."""
@@ -212,8 +207,7 @@ class TestDashboardGrouping:
         response = client.get("/")
 
         # Should show the term and empty message
-        assert "Beretta" in response.text
-        assert 'Keine Treffer für "Beretta"' in response.text
+        assert_all_in(response.text, ["Beretta", 'Keine Treffer für "Beretta"'])
 
     def test_new_count_shown_per_group(self, client, db_session):
         """Test that new match count is shown for each group."""
@@ -223,16 +217,17 @@ class TestDashboardGrouping:
         db_session.commit()
 
         # Create 2 new matches
-        for i in range(2):
-            match = Match(source_id=source.id, search_term_id=term.id,
-                         title=f"CZ 75 #{i}", url=f"https://test.ch/{i}", is_new=True)
-            db_session.add(match)
+        db_session.bulk_save_objects([
+            Match(source_id=source.id, search_term_id=term.id,
+                  title=f"CZ 75 #{i}", url=f"https://test.ch/{i}", is_new=True)
+            for i in range(2)
+        ])
         db_session.commit()
 
         response = client.get("/")
 
         # Should show "2 neue" for this group
-        assert "2 neue" in response.text
+        assert b"2 neue" in response.content
 
     def test_match_type_badge_shown(self, client, db_session):
         """Test that match type badge is shown in group header."""
@@ -244,10 +239,10 @@ class TestDashboardGrouping:
         response = client.get("/")
 
         # Should show match type badges
-        assert "exact" in response.text
-        assert "similar" in response.text
+        assert_all_in(response.text, ["exact", "similar"])
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDashboardPerformance:
     """Tests related to performance (AC: 3)."""
 
@@ -257,8 +252,6 @@ class TestDashboardPerformance:
         Note: <2 seconds requirement is for production. Test verifies
         it completes without timeout.
         """
-        import time
-
         start = time.time()
         response = client.get("/")
         elapsed = time.time() - start
@@ -268,31 +261,26 @@ class TestDashboardPerformance:
         assert elapsed < 5.0  # Give some buffer for test environment
 
 
+@pytest.mark.usefixtures("db_session", "frozen_time")
 class TestDashboardMarkAsSeen:
     """Tests for recent matches display (based on created_at date)."""
 
-    def test_recent_matches_shown_as_new(self, client, sample_data, db_session):
+    def test_recent_matches_shown_as_new(self, client, recent_matches):
         """Test that recent matches (< 7 days) show as new regardless of views.
 
-        Note: The NEU badge is now based on created_at < 7 days, not is_new flag.
-        This means viewing the dashboard does NOT reset the new status.
+        Note: The days badge is now based on created_at < 7 days, not is_new flag.
+        Viewing the dashboard does not change that, so one visit is enough.
         """
-        from datetime import datetime, timezone
-
-        # First visit - recent matches should show
-        response = client.get("/")
-        # All sample_data matches are created "now" so all are recent
-        assert "neue" in response.text
-
-        # Second visit - still shows as new (date-based, not view-based)
         response = client.get("/")
-        assert "neue" in response.text
+        # All matches are two days old, so all are recent
+        assert b"neue" in response.content
 
-    def test_new_badge_shown_for_recent_matches(self, client, sample_data):
-        """Test that NEU badge is shown for matches created within 7 days."""
+    def test_new_badge_shown_for_recent_matches(self, client, recent_matches):
+        """Test that the days badge is shown for matches created within 7 days."""
         response = client.get("/")
-        # The NEU badge should be visible for recent matches
-        assert "NEU" in response.text
+        # The badge counts days inclusively: today = 1, so two days ago = 3
+        badges = re.findall(r'<span class="new-badge [^"]*"[^>]*>(\d+)</span>', response.text)
+        assert badges == ["3"] * len(recent_matches)
 
 
 class TestHealthEndpoint:
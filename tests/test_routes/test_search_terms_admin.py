@@ -8,31 +8,19 @@ Tests the search terms administration functionality:
 - 4.4: Toggle matching type
 """
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from backend.main import app
-from backend.database import SessionLocal, Base, engine
+from backend.database import (
+    delete_search_term,
+    get_all_search_terms_sorted,
+    get_db,
+    get_search_term_by_id,
+    get_search_term_by_term,
+    update_search_term_match_type,
+)
 from backend.database.models import SearchTerm
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def db_session():
-    """Create a fresh database session for each test."""
-    Base.metadata.create_all(bind=engine)
-
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
+from tests.helpers import assert_all_in, tbody_positions
 
 
 @pytest.fixture
@@ -43,64 +31,70 @@ def sample_terms(db_session):
         SearchTerm(term="SIG 550", match_type="similar", is_active=True),
         SearchTerm(term="Beretta 92", match_type="exact", is_active=True),
     ]
-    for term in terms:
-        db_session.add(term)
-    db_session.commit()
-
-    # Refresh to get IDs
-    for term in terms:
-        db_session.refresh(term)
+    db_session.add_all(terms)
+    # Flush (not commit) so the ids are set without expiring the objects
+    db_session.flush()
 
     return terms
 
 
+@pytest.fixture(scope="module")
+def empty_admin_page(client, memory_engine):
+    """
+    Fetch /admin/search-terms once per module with an empty database.
+
+    A function-scoped db_session can't back a module-scoped fixture, so
+    get_db is overridden here for the one request.
+    """
+    session = Session(bind=memory_engine)
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        return client.get("/admin/search-terms")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+
+
+@pytest.mark.usefixtures("db_session")
 class TestDisplaySearchTermsList:
     """Tests for Story 4.1: Display Search Terms List (FR10)."""
 
-    def test_admin_page_returns_200(self, client):
+    def test_admin_page_returns_200(self, empty_admin_page):
         """Test that admin page returns 200 status."""
-        response = client.get("/admin/search-terms")
-        assert response.status_code == 200
+        assert empty_admin_page.status_code == 200
 
-    def test_admin_page_is_html(self, client):
+    def test_admin_page_is_html(self, empty_admin_page):
         """Test that admin page returns HTML."""
-        response = client.get("/admin/search-terms")
-        assert "text/html" in response.headers["content-type"]
+        assert "text/html" in empty_admin_page.headers["content-type"]
 
-    def test_admin_page_has_title(self, client):
+    def test_admin_page_has_title(self, empty_admin_page):
         """Test that admin page has correct title."""
-        response = client.get("/admin/search-terms")
-        assert "Suchbegriffe verwalten" in response.text
+        assert "Suchbegriffe verwalten" in empty_admin_page.text
 
-    def test_empty_state_shown_when_no_terms(self, client):
+    def test_empty_state_shown_when_no_terms(self, empty_admin_page):
         """Test that empty state is shown when no search terms exist."""
-        response = client.get("/admin/search-terms")
-        assert "Keine Suchbegriffe" in response.text
+        assert "Keine Suchbegriffe" in empty_admin_page.text
 
     def test_terms_listed_when_exist(self, client, sample_terms):
         """Test that search terms are listed when they exist."""
         response = client.get("/admin/search-terms")
 
-        assert "Glock 17" in response.text
-        assert "SIG 550" in response.text
-        assert "Beretta 92" in response.text
+        assert_all_in(response.text, ["Glock 17", "SIG 550", "Beretta 92"])
 
-    def test_terms_sorted_alphabetically(self, client, sample_terms):
-        """Test that search terms are sorted alphabetically."""
-        response = client.get("/admin/search-terms")
+    def test_terms_listed_in_sort_order(self, client, db_session, sample_terms):
+        """Test that search terms are listed by sort_order, not by name."""
+        glock, sig, beretta = sample_terms
+        sig.sort_order, beretta.sort_order, glock.sort_order = 0, 1, 2
+        db_session.flush()
 
-        # Extract just the table body section to avoid placeholder text in form
-        tbody_start = response.text.find("<tbody")
-        tbody_end = response.text.find("</tbody>")
-        table_content = response.text[tbody_start:tbody_end]
+        response = client.get("/admin/search-terms")
 
-        # Find positions within the table body
-        beretta_pos = table_content.find("Beretta 92")
-        glock_pos = table_content.find("Glock 17")
-        sig_pos = table_content.find("SIG 550")
+        sig_pos, beretta_pos, glock_pos = tbody_positions(
+            response.text, ["SIG 550", "Beretta 92", "Glock 17"]
+        )
 
-        # Should appear in alphabetical order: Beretta < Glock < SIG
-        assert beretta_pos < glock_pos < sig_pos
+        # Should appear in sort_order: SIG < Beretta < Glock
+        assert -1 < sig_pos < beretta_pos < glock_pos
 
     def test_match_type_shown_for_each_term(self, client, sample_terms):
         """Test that match type (exact/similar) is shown for each term."""
@@ -110,13 +104,13 @@ class TestDisplaySearchTermsList:
         assert "Exakt" in response.text
         assert "Ähnlich" in response.text
 
-    def test_add_form_present(self, client):
+    def test_add_form_present(self, empty_admin_page):
         """Test that add search term form is present."""
-        response = client.get("/admin/search-terms")
-        assert "Neuen Suchbegriff hinzufügen" in response.text
-        assert 'name="term"' in response.text
+        assert "Neuen Suchbegriff hinzufügen" in empty_admin_page.text
+        assert 'name="term"' in empty_admin_page.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestAddSearchTerm:
     """Tests for Story 4.2: Add New Search Term (FR7)."""
 
@@ -192,6 +186,7 @@ class TestAddSearchTerm:
         assert "existiert bereits" in response.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDeleteSearchTerm:
     """Tests for Story 4.3: Delete Search Term (FR8)."""
 
@@ -212,15 +207,14 @@ class TestDeleteSearchTerm:
 
         response = client.get("/admin/search-terms")
 
-        # Extract just the table body to avoid placeholder text in form
-        tbody_start = response.text.find("<tbody")
-        tbody_end = response.text.find("</tbody>")
-        table_content = response.text[tbody_start:tbody_end] if tbody_start != -1 else ""
+        glock_pos, sig_pos, beretta_pos = tbody_positions(
+            response.text, ["Glock 17", "SIG 550", "Beretta 92"]
+        )
 
-        assert "Glock 17" not in table_content
+        assert glock_pos == -1
         # Other terms should still be there in the table
-        assert "SIG 550" in table_content
-        assert "Beretta 92" in table_content
+        assert sig_pos != -1
+        assert beretta_pos != -1
 
     def test_delete_nonexistent_term(self, client, db_session):
         """Test deleting a non-existent term."""
@@ -241,80 +235,88 @@ class TestDeleteSearchTerm:
         response = client.get("/admin/search-terms")
         assert "Test" in response.text
 
-        # Find and delete it (term ID should be 1)
-        from backend.database import get_all_search_terms_sorted
-        session = SessionLocal()
-        terms = get_all_search_terms_sorted(session)
+        # Find and delete it
+        terms = get_all_search_terms_sorted(db_session)
         if terms:
             client.delete(f"/admin/search-terms/{terms[0].id}")
-        session.close()
 
         response = client.get("/admin/search-terms")
         assert "Keine Suchbegriffe" in response.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestToggleMatchType:
     """Tests for Story 4.4: Toggle Matching Type (FR9)."""
 
-    def test_toggle_exact_to_similar(self, client, sample_terms, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_exact_to_similar(self, async_client, sample_terms, db_session):
         """Test toggling match type from exact to similar."""
         # Glock 17 is exact
         term_id = sample_terms[0].id
 
-        response = client.patch(f"/admin/search-terms/{term_id}/match-type")
+        response = await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
 
         assert response.status_code == 200
         # Response should show updated row with "Ähnlich"
         assert "Ähnlich" in response.text
 
-    def test_toggle_similar_to_exact(self, client, sample_terms, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_similar_to_exact(self, async_client, sample_terms, db_session):
         """Test toggling match type from similar to exact."""
         # SIG 550 is similar
         term_id = sample_terms[1].id
 
-        response = client.patch(f"/admin/search-terms/{term_id}/match-type")
+        response = await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
 
         assert response.status_code == 200
         # Response should show updated row with "Exakt"
         assert "Exakt" in response.text
 
-    def test_toggle_persists_to_database(self, client, sample_terms, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_persists_to_database(self, async_client, sample_terms, db_session):
         """Test that toggle persists to database."""
         term_id = sample_terms[0].id  # Glock 17 - exact
 
-        client.patch(f"/admin/search-terms/{term_id}/match-type")
+        await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
 
         # Refresh session to get updated data
         db_session.expire_all()
         term = db_session.query(SearchTerm).filter(SearchTerm.id == term_id).first()
         assert term.match_type == "similar"
 
-    def test_toggle_twice_returns_to_original(self, client, sample_terms, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_twice_returns_to_original(
+        self, async_client, sample_terms, db_session
+    ):
         """Test that toggling twice returns to original value."""
         term_id = sample_terms[0].id  # Glock 17 - exact
 
         # Toggle once (exact -> similar)
-        client.patch(f"/admin/search-terms/{term_id}/match-type")
+        await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
         # Toggle again (similar -> exact)
-        client.patch(f"/admin/search-terms/{term_id}/match-type")
+        await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
 
         db_session.expire_all()
         term = db_session.query(SearchTerm).filter(SearchTerm.id == term_id).first()
         assert term.match_type == "exact"
 
-    def test_toggle_nonexistent_term(self, client, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_nonexistent_term(self, async_client, db_session):
         """Test toggling non-existent term."""
-        response = client.patch("/admin/search-terms/9999/match-type")
+        response = await async_client.patch("/admin/search-terms/9999/match-type")
 
         # Should return 200 with error message
         assert response.status_code == 200
 
-    def test_toggle_updates_display_immediately(self, client, sample_terms, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_updates_display_immediately(
+        self, async_client, sample_terms, db_session
+    ):
         """Test that toggle updates the display immediately."""
         term_id = sample_terms[0].id
 
         # Toggle and check response contains updated badge
-        response = client.patch(f"/admin/search-terms/{term_id}/match-type")
+        response = await async_client.patch(f"/admin/search-terms/{term_id}/match-type")
 
         # Should contain the new badge in the HTMX response
         assert f'id="term-row-{term_id}"' in response.text
@@ -325,8 +327,6 @@ class TestCRUDFunctions:
 
     def test_get_all_search_terms_sorted(self, db_session, sample_terms):
         """Test that get_all_search_terms_sorted returns alphabetically sorted terms."""
-        from backend.database import get_all_search_terms_sorted
-
         terms = get_all_search_terms_sorted(db_session)
 
         assert len(terms) == 3
@@ -336,25 +336,13 @@ class TestCRUDFunctions:
 
     def test_get_search_term_by_id(self, db_session, sample_terms):
         """Test getting search term by ID."""
-        from backend.database import get_search_term_by_id
-
         term = get_search_term_by_id(db_session, sample_terms[0].id)
 
         assert term is not None
         assert term.term == "Glock 17"
 
-    def test_get_search_term_by_id_not_found(self, db_session):
-        """Test getting non-existent search term by ID."""
-        from backend.database import get_search_term_by_id
-
-        term = get_search_term_by_id(db_session, 9999)
-
-        assert term is None
-
     def test_get_search_term_by_term(self, db_session, sample_terms):
         """Test getting search term by term text."""
-        from backend.database import get_search_term_by_term
-
         term = get_search_term_by_term(db_session, "Glock 17")
 
         assert term is not None
@@ -362,8 +350,6 @@ class TestCRUDFunctions:
 
     def test_get_search_term_by_term_case_insensitive(self, db_session, sample_terms):
         """Test that get_search_term_by_term is case-insensitive."""
-        from backend.database import get_search_term_by_term
-
         term = get_search_term_by_term(db_session, "glock 17")
 
         assert term is not None
@@ -371,26 +357,14 @@ class TestCRUDFunctions:
 
     def test_delete_search_term(self, db_session, sample_terms):
         """Test deleting a search term."""
-        from backend.database import delete_search_term, get_search_term_by_id
-
         term_id = sample_terms[0].id
         result = delete_search_term(db_session, term_id)
 
         assert result is True
         assert get_search_term_by_id(db_session, term_id) is None
 
-    def test_delete_search_term_not_found(self, db_session):
-        """Test deleting non-existent search term."""
-        from backend.database import delete_search_term
-
-        result = delete_search_term(db_session, 9999)
-
-        assert result is False
-
     def test_update_search_term_match_type(self, db_session, sample_terms):
         """Test updating search term match type."""
-        from backend.database import update_search_term_match_type
-
         term_id = sample_terms[0].id  # exact
         updated = update_search_term_match_type(db_session, term_id, "similar")
 
@@ -399,17 +373,20 @@ class TestCRUDFunctions:
 
     def test_update_search_term_match_type_invalid(self, db_session, sample_terms):
         """Test updating with invalid match type raises error."""
-        from backend.database import update_search_term_match_type
-
         term_id = sample_terms[0].id
 
         with pytest.raises(ValueError):
             update_search_term_match_type(db_session, term_id, "invalid")
 
-    def test_update_search_term_match_type_not_found(self, db_session):
-        """Test updating non-existent term returns None."""
-        from backend.database import update_search_term_match_type
-
-        result = update_search_term_match_type(db_session, 9999, "similar")
-
-        assert result is None
+    @pytest.mark.parametrize(
+        "call, expected",
+        [
+            (lambda session: get_search_term_by_id(session, 9999), None),
+            (lambda session: delete_search_term(session, 9999), False),
+            (lambda session: update_search_term_match_type(session, 9999, "similar"), None),
+        ],
+        ids=["get_by_id", "delete", "update_match_type"],
+    )
+    def test_not_found(self, db_session, call, expected):
+        """Test that CRUD helpers report a non-existent term instead of raising."""
+        assert call(db_session) is expected
@@ -9,37 +9,24 @@ Tests the sources administration functionality:
 """
 from datetime import datetime, timezone
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 from backend.main import app
-from backend.database import SessionLocal, Base, engine
+from backend.database import (
+    clear_source_error,
+    get_all_sources_sorted,
+    get_db,
+    get_source_by_id,
+    toggle_source_active,
+    update_source_last_crawl,
+)
 from backend.database.models import Source
+from tests.helpers import assert_all_in, tbody_positions
 
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def db_session():
-    """Create a fresh database session for each test."""
-    Base.metadata.create_all(bind=engine)
-
-    session = SessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
-
-
-@pytest.fixture
-def sample_sources(db_session):
-    """Create sample sources for testing."""
-    sources = [
+def make_sample_sources():
+    """Build the sample sources (unsaved) shared by the fixtures below."""
+    return [
         Source(
             name="waffenboerse.ch",
             base_url="https://www.waffenboerse.ch",
@@ -62,181 +49,213 @@ def sample_sources(db_session):
             last_error=None,
         ),
     ]
-    for source in sources:
-        db_session.add(source)
-    db_session.commit()
 
-    for source in sources:
-        db_session.refresh(source)
+
+@pytest.fixture
+def sample_sources(db_session):
+    """Create sample sources for testing."""
+    sources = make_sample_sources()
+    db_session.add_all(sources)
+    # Flush (not commit) so the ids are set without expiring the objects
+    db_session.flush()
 
     return sources
 
 
+@pytest.fixture(scope="module")
+def empty_admin_page(client, memory_engine):
+    """
+    Fetch /admin/sources once per module with an empty database.
+
+    A function-scoped db_session can't back a module-scoped fixture, so
+    get_db is overridden here for the one request.
+    """
+    session = Session(bind=memory_engine)
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        return client.get("/admin/sources")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+
+
+@pytest.fixture(scope="module")
+def sources_page(client, memory_engine):
+    """
+    Fetch /admin/sources once per module with the sample sources in place.
+
+    The rows are added inside a transaction that is rolled back right after
+    the request, so the function-scoped tests still start from empty tables.
+    """
+    connection = memory_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    session.add_all(make_sample_sources())
+    session.flush()
+
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        return client.get("/admin/sources")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.mark.usefixtures("db_session")
 class TestDisplaySourcesList:
     """Tests for Story 5.1: Display Sources List (FR11)."""
 
-    def test_admin_page_returns_200(self, client):
+    def test_admin_page_returns_200(self, empty_admin_page):
         """Test that admin page returns 200 status."""
-        response = client.get("/admin/sources")
-        assert response.status_code == 200
+        assert empty_admin_page.status_code == 200
 
-    def test_admin_page_is_html(self, client):
+    def test_admin_page_is_html(self, empty_admin_page):
         """Test that admin page returns HTML."""
-        response = client.get("/admin/sources")
-        assert "text/html" in response.headers["content-type"]
+        assert "text/html" in empty_admin_page.headers["content-type"]
 
-    def test_admin_page_has_title(self, client):
+    def test_admin_page_has_title(self, empty_admin_page):
         """Test that admin page has correct title."""
-        response = client.get("/admin/sources")
-        assert "Quellen verwalten" in response.text
+        assert "Quellen verwalten" in empty_admin_page.text
 
-    def test_empty_state_shown_when_no_sources(self, client):
+    def test_empty_state_shown_when_no_sources(self, empty_admin_page):
         """Test that empty state is shown when no sources exist."""
-        response = client.get("/admin/sources")
-        assert "Keine Quellen" in response.text
+        assert "Keine Quellen" in empty_admin_page.text
 
-    def test_sources_listed_when_exist(self, client, sample_sources):
+    def test_sources_listed_when_exist(self, sources_page):
         """Test that sources are listed when they exist."""
-        response = client.get("/admin/sources")
-
-        assert "waffenboerse.ch" in response.text
-        assert "waffengebraucht.ch" in response.text
-        assert "waffenzimmi.ch" in response.text
+        assert_all_in(
+            sources_page.text, ["waffenboerse.ch", "waffengebraucht.ch", "waffenzimmi.ch"]
+        )
 
-    def test_sources_sorted_alphabetically(self, client, sample_sources):
+    def test_sources_sorted_alphabetically(self, sources_page):
         """Test that sources are sorted alphabetically."""
-        response = client.get("/admin/sources")
-
-        # Extract just the table body
-        tbody_start = response.text.find("<tbody")
-        tbody_end = response.text.find("</tbody>")
-        table_content = response.text[tbody_start:tbody_end]
-
-        # Find positions within the table body
-        boerse_pos = table_content.find("waffenboerse.ch")
-        gebraucht_pos = table_content.find("waffengebraucht.ch")
-        zimmi_pos = table_content.find("waffenzimmi.ch")
+        boerse_pos, gebraucht_pos, zimmi_pos = tbody_positions(
+            sources_page.text, ["waffenboerse.ch", "waffengebraucht.ch", "waffenzimmi.ch"]
+        )
 
         # Should appear in alphabetical order
         assert boerse_pos < gebraucht_pos < zimmi_pos
 
-    def test_source_url_displayed(self, client, sample_sources):
+    def test_source_url_displayed(self, sources_page):
         """Test that source URLs are displayed."""
-        response = client.get("/admin/sources")
-
-        assert "https://www.waffenboerse.ch" in response.text
-        assert "https://www.waffengebraucht.ch" in response.text
+        assert "https://www.waffenboerse.ch" in sources_page.text
+        assert "https://www.waffengebraucht.ch" in sources_page.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestToggleSourceActive:
     """Tests for Story 5.2: Toggle Source Active State (FR12)."""
 
-    def test_toggle_active_to_inactive(self, client, sample_sources, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_active_to_inactive(self, async_client, sample_sources, db_session):
         """Test toggling source from active to inactive."""
         source_id = sample_sources[0].id  # waffenboerse.ch is active
 
-        response = client.patch(f"/admin/sources/{source_id}/toggle")
+        response = await async_client.patch(f"/admin/sources/{source_id}/toggle")
 
         assert response.status_code == 200
         assert "Inaktiv" in response.text
 
-    def test_toggle_inactive_to_active(self, client, sample_sources, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_inactive_to_active(self, async_client, sample_sources, db_session):
         """Test toggling source from inactive to active."""
         source_id = sample_sources[2].id  # waffenzimmi.ch is inactive
 
-        response = client.patch(f"/admin/sources/{source_id}/toggle")
+        response = await async_client.patch(f"/admin/sources/{source_id}/toggle")
 
         assert response.status_code == 200
         assert "Aktiv" in response.text
 
-    def test_toggle_persists_to_database(self, client, sample_sources, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_persists_to_database(self, async_client, sample_sources, db_session):
         """Test that toggle persists to database."""
         source_id = sample_sources[0].id  # active
 
-        client.patch(f"/admin/sources/{source_id}/toggle")
+        await async_client.patch(f"/admin/sources/{source_id}/toggle")
 
         db_session.expire_all()
         source = db_session.query(Source).filter(Source.id == source_id).first()
         assert source.is_active is False
 
-    def test_toggle_twice_returns_to_original(self, client, sample_sources, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_twice_returns_to_original(
+        self, async_client, sample_sources, db_session
+    ):
         """Test that toggling twice returns to original value."""
         source_id = sample_sources[0].id  # active
 
-        client.patch(f"/admin/sources/{source_id}/toggle")  # -> inactive
-        client.patch(f"/admin/sources/{source_id}/toggle")  # -> active
+        await async_client.patch(f"/admin/sources/{source_id}/toggle")  # -> inactive
+        await async_client.patch(f"/admin/sources/{source_id}/toggle")  # -> active
 
         db_session.expire_all()
         source = db_session.query(Source).filter(Source.id == source_id).first()
         assert source.is_active is True
 
-    def test_toggle_nonexistent_source(self, client, db_session):
+    @pytest.mark.asyncio
+    async def test_toggle_nonexistent_source(self, async_client, db_session):
         """Test toggling non-existent source."""
-        response = client.patch("/admin/sources/9999/toggle")
+        response = await async_client.patch("/admin/sources/9999/toggle")
         assert response.status_code == 200
 
-    def test_deactivate_button_shown_for_active(self, client, sample_sources):
+    @pytest.mark.asyncio
+    async def test_deactivate_button_shown_for_active(self, async_client, sample_sources):
         """Test that deactivate button is shown for active sources."""
-        response = client.get("/admin/sources")
+        response = await async_client.get("/admin/sources")
         assert "Deaktivieren" in response.text
 
-    def test_activate_button_shown_for_inactive(self, client, sample_sources):
+    @pytest.mark.asyncio
+    async def test_activate_button_shown_for_inactive(self, async_client, sample_sources):
         """Test that activate button is shown for inactive sources."""
-        response = client.get("/admin/sources")
+        response = await async_client.get("/admin/sources")
         assert "Aktivieren" in response.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDisplaySourceStatus:
     """Tests for Story 5.3: Display Source Status (FR13)."""
 
-    def test_active_status_badge_shown(self, client, sample_sources):
+    def test_active_status_badge_shown(self, sources_page):
         """Test that active status badge is shown."""
-        response = client.get("/admin/sources")
-        assert "Aktiv" in response.text
+        assert "Aktiv" in sources_page.text
 
-    def test_inactive_status_badge_shown(self, client, sample_sources):
+    def test_inactive_status_badge_shown(self, sources_page):
         """Test that inactive status badge is shown."""
-        response = client.get("/admin/sources")
-        assert "Inaktiv" in response.text
+        assert "Inaktiv" in sources_page.text
 
-    def test_last_crawl_timestamp_shown(self, client, sample_sources):
+    def test_last_crawl_timestamp_shown(self, sources_page):
         """Test that last crawl timestamp is shown."""
-        response = client.get("/admin/sources")
-
         # Should show the date in German format
-        assert "15.01.2024" in response.text
-        assert "10:30" in response.text
+        assert "15.01.2024" in sources_page.text
+        assert "10:30" in sources_page.text
 
-    def test_never_crawled_shows_nie(self, client, sample_sources):
+    def test_never_crawled_shows_nie(self, sources_page):
         """Test that 'Nie' is shown when never crawled."""
-        response = client.get("/admin/sources")
-        assert "Nie" in response.text
+        assert "Nie" in sources_page.text
 
-    def test_ok_status_shown_for_successful_crawl(self, client, sample_sources):
+    def test_ok_status_shown_for_successful_crawl(self, sources_page):
         """Test that OK status is shown for successful crawl."""
-        response = client.get("/admin/sources")
         # waffenboerse.ch has no error and was crawled
         # The OK text may have whitespace around it in the span
-        assert "bg-green-100" in response.text and "OK" in response.text
+        assert "bg-green-100" in sources_page.text and "OK" in sources_page.text
 
 
+@pytest.mark.usefixtures("db_session")
 class TestDisplaySourceErrors:
     """Tests for Story 5.4: Display Source Errors (FR14)."""
 
-    def test_error_badge_shown(self, client, sample_sources):
+    def test_error_badge_shown(self, sources_page):
         """Test that error badge is shown when source has error."""
-        response = client.get("/admin/sources")
-        assert "Fehler" in response.text
+        assert "Fehler" in sources_page.text
 
-    def test_error_message_displayed(self, client, sample_sources):
+    def test_error_message_displayed(self, sources_page):
         """Test that error message is displayed."""
-        response = client.get("/admin/sources")
-        assert "Connection timeout" in response.text
+        assert "Connection timeout" in sources_page.text
 
-    def test_clear_error_button_shown(self, client, sample_sources):
+    def test_clear_error_button_shown(self, sources_page):
         """Test that clear error button is shown for sources with errors."""
-        response = client.get("/admin/sources")
-        assert "Zurücksetzen" in response.text
+        assert "Zurücksetzen" in sources_page.text
 
     def test_clear_error_removes_error(self, client, sample_sources, db_session):
         """Test that clearing error removes the error message."""
@@ -282,8 +301,6 @@ class TestCRUDFunctions:
 
     def test_get_all_sources_sorted(self, db_session, sample_sources):
         """Test that get_all_sources_sorted returns alphabetically sorted sources."""
-        from backend.database import get_all_sources_sorted
-
         sources = get_all_sources_sorted(db_session)
 
         assert len(sources) == 3
@@ -293,25 +310,13 @@ class TestCRUDFunctions:
 
     def test_get_source_by_id(self, db_session, sample_sources):
         """Test getting source by ID."""
-        from backend.database import get_source_by_id
-
         source = get_source_by_id(db_session, sample_sources[0].id)
 
         assert source is not None
         assert source.name == "waffenboerse.ch"
 
-    def test_get_source_by_id_not_found(self, db_session):
-        """Test getting non-existent source by ID."""
-        from backend.database import get_source_by_id
-
-        source = get_source_by_id(db_session, 9999)
-
-        assert source is None
-
     def test_toggle_source_active(self, db_session, sample_sources):
         """Test toggling source active state."""
-        from backend.database import toggle_source_active
-
         source_id = sample_sources[0].id
         original_state = sample_sources[0].is_active
 
@@ -320,18 +325,8 @@ class TestCRUDFunctions:
         assert toggled is not None
         assert toggled.is_active != original_state
 
-    def test_toggle_source_active_not_found(self, db_session):
-        """Test toggling non-existent source."""
-        from backend.database import toggle_source_active
-
-        result = toggle_source_active(db_session, 9999)
-
-        assert result is None
-
     def test_update_source_last_crawl_success(self, db_session, sample_sources):
         """Test updating source last crawl on success."""
-        from backend.database import update_source_last_crawl
-
         source_id = sample_sources[0].id
 
         updated = update_source_last_crawl(db_session, source_id, error=None)
@@ -342,8 +337,6 @@ class TestCRUDFunctions:
 
     def test_update_source_last_crawl_with_error(self, db_session, sample_sources):
         """Test updating source last crawl with error."""
-        from backend.database import update_source_last_crawl
-
         source_id = sample_sources[0].id
         error_msg = "Test error message"
 
@@ -354,8 +347,6 @@ class TestCRUDFunctions:
 
     def test_clear_source_error(self, db_session, sample_sources):
         """Test clearing source error."""
-        from backend.database import clear_source_error
-
         source_id = sample_sources[1].id  # has error
 
         cleared = clear_source_error(db_session, source_id)
@@ -363,10 +354,10 @@ class TestCRUDFunctions:
         assert cleared is not None
         assert cleared.last_error is None
 
-    def test_clear_source_error_not_found(self, db_session):
-        """Test clearing error on non-existent source."""
-        from backend.database import clear_source_error
-
-        result = clear_source_error(db_session, 9999)
-
-        assert result is None
+    @pytest.mark.parametrize(
+        "crud_function",
+        [get_source_by_id, toggle_source_active, clear_source_error],
+    )
+    def test_not_found(self, db_session, crud_function):
+        """Test that CRUD helpers return None for a non-existent source."""
+        assert crud_function(db_session, 9999) is None
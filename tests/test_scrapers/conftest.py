@@ -0,0 +1,55 @@
+"""
+Shared fixtures for scraper tests.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def mock_http_client():
+    """
+    Return a factory for mocked create_http_client() clients.
+
+    The client is an async context manager whose get() returns a response
+    with the given text or JSON payload, or raises side_effect instead.
+
+    Usage:
+        mock_client = mock_http_client(text=SAMPLE_HTML)
+        with patch("backend.scrapers.x.create_http_client", return_value=mock_client):
+            ...
+    """
+    def make_client(*, text=None, json_data=None, side_effect=None):
+        mock_client = AsyncMock()
+        if side_effect is not None:
+            mock_client.get = AsyncMock(side_effect=side_effect)
+        else:
+            mock_response = MagicMock()
+            mock_response.raise_for_status = MagicMock()
+            if text is not None:
+                mock_response.text = text
+            if json_data is not None:
+                mock_response.json = MagicMock(return_value=json_data)
+            mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        return mock_client
+
+    return make_client
+
+
+@pytest.fixture(
+    params=[
+        httpx.HTTPStatusError(
+            "Server Error",
+            request=MagicMock(),
+            response=MagicMock(status_code=500),
+        ),
+        httpx.ConnectError("Connection refused"),
+    ],
+    ids=["http_error", "connection_error"],
+)
+def request_error(request):
+    """Exception raised by the mocked client's get(); runs once per error type."""
+    return request.param
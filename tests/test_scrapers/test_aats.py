@@ -7,9 +7,7 @@ Tests verify:
 - Title extraction from slug
 - Error handling
 """
-from unittest.mock import AsyncMock, MagicMock, patch
 
-import httpx
 import pytest
 
 from backend.scrapers.aats import (
@@ -17,6 +15,7 @@ from backend.scrapers.aats import (
     SOURCE_NAME,
     scrape_aats,
 )
+from tests.helpers import patch_scraper
 
 
 # Sample sitemap XML
@@ -39,20 +38,12 @@ class TestScrapeAats:
     """Tests for scrape_aats main function."""
 
     @pytest.mark.asyncio
-    async def test_finds_matching_products(self):
+    async def test_finds_matching_products(self, mock_http_client):
         """Test that scraper finds products matching search terms."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_SITEMAP
-        mock_response.raise_for_status = MagicMock()
+        mock_client = mock_http_client(text=SAMPLE_SITEMAP)
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.aats.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aats(search_terms=["sig", "glock"])
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            results = await scrape_aats(search_terms=["sig", "glock"])
 
         assert len(results) == 2
         titles = [r["title"].lower() for r in results]
@@ -60,58 +51,46 @@ class TestScrapeAats:
         assert any("glock" in t for t in titles)
 
     @pytest.mark.asyncio
-    async def test_deduplicates_results(self):
+    async def test_deduplicates_results(self, mock_http_client):
         """Test that same product is not added multiple times for different terms."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_SITEMAP
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client = mock_http_client(text=SAMPLE_SITEMAP)
 
-        with patch("backend.scrapers.aats.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                # Both terms match the same product
-                results = await scrape_aats(search_terms=["sig", "p226"])
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            # Both terms match the same product
+            results = await scrape_aats(search_terms=["sig", "p226"])
 
         # Should only have 1 result, not 2
         assert len(results) == 1
 
     @pytest.mark.asyncio
-    async def test_returns_empty_for_no_matches(self):
+    async def test_returns_empty_for_no_matches(self, mock_http_client):
         """Test that scraper returns empty list when no products match."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_SITEMAP
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client = mock_http_client(text=SAMPLE_SITEMAP)
 
-        with patch("backend.scrapers.aats.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aats(search_terms=["nonexistent"])
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            results = await scrape_aats(search_terms=["nonexistent"])
 
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_returns_empty_list_on_http_error(self):
-        """Test that HTTP errors return empty list."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=MagicMock(status_code=500)
-        ))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.aats.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aats(search_terms=["sig"])
+    async def test_matches_terms_literally(self, mock_http_client):
+        """Test that spaced terms match hyphenated slugs and regex characters are literal."""
+        mock_client = mock_http_client(text=SAMPLE_SITEMAP)
+
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            # "." must not act as a wildcard matching the "-" in "hk-p30-sk"
+            results = await scrape_aats(search_terms=["glock 17", "p30.sk"])
+
+        assert len(results) == 1
+        assert "glock-17" in results[0]["link"]
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_list_on_request_error(self, mock_http_client, request_error):
+        """Test that HTTP and connection errors return empty list."""
+        mock_client = mock_http_client(side_effect=request_error)
+
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            results = await scrape_aats(search_terms=["sig"])
 
         assert results == []
 
@@ -122,20 +101,12 @@ class TestScrapeAats:
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_extracts_correct_fields(self):
+    async def test_extracts_correct_fields(self, mock_http_client):
         """Test that result has correct fields."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_SITEMAP
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.aats.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aats(search_terms=["sig"])
+        mock_client = mock_http_client(text=SAMPLE_SITEMAP)
+
+        with patch_scraper("backend.scrapers.aats", mock_client):
+            results = await scrape_aats(search_terms=["sig"])
 
         assert len(results) == 1
         result = results[0]
@@ -8,9 +8,7 @@ Tests verify:
 - Error handling returns empty list
 - Pagination detection
 """
-from unittest.mock import AsyncMock, MagicMock, patch
 
-import httpx
 import pytest
 
 from backend.scrapers.aebiwaffen import (
@@ -24,7 +22,8 @@ from backend.scrapers.aebiwaffen import (
     _has_next_page,
     _parse_listing,
 )
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from tests.helpers import patch_scraper
 
 
 # Sample HTML fixtures mimicking aebiwaffen.ch structure
@@ -108,25 +107,29 @@ SAMPLE_HTML_MISSING_PRICE = """
 """
 
 
+# Full-page fixtures parsed once; _has_next_page only reads the tree
+SOUP_WITH_PAGINATION = BeautifulSoup(SAMPLE_HTML_WITH_PAGINATION, "lxml")
+SOUP_NO_LISTINGS = BeautifulSoup(SAMPLE_HTML_NO_LISTINGS, "lxml")
+
+# Only <li> subtrees are built when parsing listing snippets
+LI_ONLY = SoupStrainer("li")
+
+
+def _first_li(html):
+    """Parse html and return its first <li> element."""
+    return BeautifulSoup(html, "lxml", parse_only=LI_ONLY).li
+
+
 class TestScrapeAebiwaffen:
     """Tests for scrape_aebiwaffen main function."""
 
     @pytest.mark.asyncio
-    async def test_extracts_single_listing(self):
+    async def test_extracts_single_listing(self, mock_http_client):
         """Test that scraper extracts a single listing correctly."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_HTML_SINGLE_LISTING
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client = mock_http_client(text=SAMPLE_HTML_SINGLE_LISTING)
 
-        with patch("backend.scrapers.aebiwaffen.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.aebiwaffen.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_aebiwaffen()
+        with patch_scraper("backend.scrapers.aebiwaffen", mock_client):
+            results = await scrape_aebiwaffen()
 
         assert len(results) == 1
         assert results[0]["title"] == "SIG Sauer P226"
@@ -134,53 +137,22 @@ class TestScrapeAebiwaffen:
         assert results[0]["source"] == SOURCE_NAME
 
     @pytest.mark.asyncio
-    async def test_extracts_multiple_listings(self):
+    async def test_extracts_multiple_listings(self, mock_http_client):
         """Test that scraper extracts multiple listings."""
-        mock_response = MagicMock()
-        mock_response.text = SAMPLE_HTML_MULTIPLE_LISTINGS
-        mock_response.raise_for_status = MagicMock()
+        mock_client = mock_http_client(text=SAMPLE_HTML_MULTIPLE_LISTINGS)
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.aebiwaffen.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.aebiwaffen.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_aebiwaffen()
+        with patch_scraper("backend.scrapers.aebiwaffen", mock_client):
+            results = await scrape_aebiwaffen()
 
         assert len(results) == 3
 
     @pytest.mark.asyncio
-    async def test_returns_empty_list_on_http_error(self):
-        """Test that HTTP errors return empty list."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=MagicMock(status_code=500)
-        ))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.aebiwaffen.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aebiwaffen()
-
-        assert results == []
-
-    @pytest.mark.asyncio
-    async def test_returns_empty_list_on_connection_error(self):
-        """Test that connection errors return empty list."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+    async def test_returns_empty_list_on_request_error(self, mock_http_client, request_error):
+        """Test that HTTP and connection errors return empty list."""
+        mock_client = mock_http_client(side_effect=request_error)
 
-        with patch("backend.scrapers.aebiwaffen.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_aebiwaffen()
+        with patch_scraper("backend.scrapers.aebiwaffen", mock_client):
+            results = await scrape_aebiwaffen()
 
         assert results == []
 
@@ -191,36 +163,31 @@ class TestExtractTitle:
     def test_extracts_title_from_h3_a(self):
         """Extract title from h3 > a structure."""
         html = '<li><h3><a href="/de/123/gun">Test Gun</a></h3></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_title(listing) == "Test Gun"
 
     def test_extracts_title_from_h3(self):
         """Extract title from h3 element."""
         html = '<li><h3>Test Gun</h3></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_title(listing) == "Test Gun"
 
     def test_extracts_title_from_link(self):
         """Extract title from link with /de/ in href."""
         html = '<li><a href="/de/123/test-gun">Test Gun</a></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_title(listing) == "Test Gun"
 
     def test_returns_none_for_missing_title(self):
         """Return None when no title element found."""
         html = '<li><span>abc</span></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_title(listing) is None
 
     def test_skips_short_text(self):
         """Skip text that is too short."""
         html = '<li><h3>ab</h3></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_title(listing) is None
 
 
@@ -230,36 +197,31 @@ class TestExtractPrice:
     def test_extracts_price_with_stk_format(self):
         """Extract price from Swiss format with / Stk."""
         html = "<li><div>1'200.00 / Stk.</div></li>"
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_price(listing) == 1200.0
 
     def test_extracts_price_with_chf(self):
         """Extract price with CHF prefix."""
         html = '<li><span>CHF 850.50</span></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_price(listing) == 850.5
 
     def test_extracts_price_with_fr(self):
         """Extract price with Fr. prefix."""
         html = "<li><span>Fr. 2'500.-</span></li>"
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_price(listing) == 2500.0
 
     def test_returns_none_for_missing_price(self):
         """Return None when no price found."""
         html = '<li><span>No price here</span></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_price(listing) is None
 
     def test_handles_unicode_apostrophe(self):
         """Handle Unicode apostrophe in price."""
         html = "<li><div>6\u2019950.00 / Stk.</div></li>"
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_price(listing) == 6950.0
 
 
@@ -269,31 +231,27 @@ class TestExtractLink:
     def test_extracts_link_from_h3_a(self):
         """Extract link from h3 > a structure."""
         html = '<li><h3><a href="/de/12345/sig-p226">SIG P226</a></h3></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         link = _extract_link(listing)
         assert link == f"{BASE_URL}/de/12345/sig-p226"
 
     def test_extracts_link_with_de_path(self):
         """Extract link with /de/ in path."""
         html = '<li><a href="/de/123/test-gun">Test</a></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         link = _extract_link(listing)
         assert link == f"{BASE_URL}/de/123/test-gun"
 
     def test_returns_none_for_missing_link(self):
         """Return None when no valid link found."""
         html = '<li><span>No link</span></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_link(listing) is None
 
     def test_returns_none_for_non_product_link(self):
         """Return None for links without product ID pattern."""
         html = '<li><a href="/de/waffen/">Waffen</a></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_link(listing) is None
 
 
@@ -303,31 +261,27 @@ class TestExtractImageUrl:
     def test_extracts_image_from_src(self):
         """Extract image URL from src attribute."""
         html = '<li><img src="/images/gun.jpg"></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         image_url = _extract_image_url(listing)
         assert image_url == f"{BASE_URL}/images/gun.jpg"
 
     def test_extracts_image_from_data_src(self):
         """Extract image URL from data-src attribute (lazy loading)."""
         html = '<li><img data-src="/images/lazy.jpg"></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         image_url = _extract_image_url(listing)
         assert image_url == f"{BASE_URL}/images/lazy.jpg"
 
     def test_returns_none_for_missing_image(self):
         """Return None when no image found."""
         html = '<li><span>No image</span></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_image_url(listing) is None
 
     def test_skips_placeholder_images(self):
         """Skip images that are placeholders."""
         html = '<li><img src="/images/placeholder.gif"></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         assert _extract_image_url(listing) is None
 
 
@@ -336,13 +290,11 @@ class TestHasNextPage:
 
     def test_detects_next_page_link(self):
         """Detect pagination with seite parameter."""
-        soup = BeautifulSoup(SAMPLE_HTML_WITH_PAGINATION, "lxml")
-        assert _has_next_page(soup, current_page=1) is True
+        assert _has_next_page(SOUP_WITH_PAGINATION, current_page=1) is True
 
     def test_returns_false_for_no_pagination(self):
         """Return False when no pagination found."""
-        soup = BeautifulSoup(SAMPLE_HTML_NO_LISTINGS, "lxml")
-        assert _has_next_page(soup, current_page=1) is False
+        assert _has_next_page(SOUP_NO_LISTINGS, current_page=1) is False
 
     def test_returns_false_when_on_last_page(self):
         """Return False when on last page."""
@@ -377,6 +329,16 @@ class TestHasNextPage:
         soup = BeautifulSoup(html, "lxml")
         assert _has_next_page(soup, current_page=1) is True
 
+    def test_detects_rel_next_link(self):
+        """Detect pagination via rel="next" link."""
+        html = """
+        <html><body>
+            <a rel="next" href="/de/waffen?page=next"><span>&gt;</span></a>
+        </body></html>
+        """
+        soup = BeautifulSoup(html, "lxml")
+        assert _has_next_page(soup, current_page=1) is True
+
 
 class TestParseListing:
     """Tests for _parse_listing helper function."""
@@ -390,8 +352,7 @@ class TestParseListing:
             <div>1'000.00 / Stk.</div>
         </li>
         """
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         result = _parse_listing(listing)
 
         assert result is not None
@@ -404,16 +365,14 @@ class TestParseListing:
     def test_returns_none_for_missing_title(self):
         """Return None when title is missing."""
         html = '<li><a href="/de/123/item"></a></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         result = _parse_listing(listing)
         assert result is None
 
     def test_returns_none_for_missing_link(self):
         """Return None when link is missing."""
         html = '<li><h3>Test</h3></li>'
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         result = _parse_listing(listing)
         assert result is None
 
@@ -424,8 +383,7 @@ class TestParseListing:
             <h3><a href="/de/12345/test-gun">Test Gun</a></h3>
         </li>
         """
-        soup = BeautifulSoup(html, "lxml")
-        listing = soup.select_one("li")
+        listing = _first_li(html)
         result = _parse_listing(listing)
 
         assert result is not None
@@ -9,9 +9,7 @@ Tests verify:
 - Error handling
 """
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
 
-import httpx
 import pytest
 
 from backend.scrapers.armashop import (
@@ -19,6 +17,7 @@ from backend.scrapers.armashop import (
     SOURCE_NAME,
     scrape_armashop,
 )
+from tests.helpers import patch_scraper
 
 
 # Sample API response
@@ -57,21 +56,12 @@ class TestScrapeArmashop:
     """Tests for scrape_armashop main function."""
 
     @pytest.mark.asyncio
-    async def test_extracts_products_from_api(self):
+    async def test_extracts_products_from_api(self, mock_http_client):
         """Test that scraper extracts products from API response."""
-        mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value=SAMPLE_API_RESPONSE)
-        mock_response.raise_for_status = MagicMock()
+        mock_client = mock_http_client(json_data=SAMPLE_API_RESPONSE)
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.armashop.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_armashop(search_terms=["sig"])
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            results = await scrape_armashop(search_terms=["sig"])
 
         assert len(results) == 2
         assert results[0]["title"] == "SIG Sauer P226"
@@ -79,81 +69,46 @@ class TestScrapeArmashop:
         assert results[0]["source"] == SOURCE_NAME
 
     @pytest.mark.asyncio
-    async def test_converts_price_from_centimes(self):
+    async def test_converts_price_from_centimes(self, mock_http_client):
         """Test that price is correctly converted from centimes."""
-        mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value=SAMPLE_API_RESPONSE)
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client = mock_http_client(json_data=SAMPLE_API_RESPONSE)
 
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.armashop.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_armashop(search_terms=["glock"])
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            results = await scrape_armashop(search_terms=["glock"])
 
         glock = next(r for r in results if "Glock" in r["title"])
         assert glock["price"] == 850.0
 
     @pytest.mark.asyncio
-    async def test_decodes_html_entities(self):
+    async def test_decodes_html_entities(self, mock_http_client):
         """Test that HTML entities in product names are decoded."""
-        mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value=SAMPLE_API_RESPONSE_WITH_HTML)
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
+        mock_client = mock_http_client(json_data=SAMPLE_API_RESPONSE_WITH_HTML)
 
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.armashop.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_armashop(search_terms=["test"])
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            results = await scrape_armashop(search_terms=["test"])
 
         assert len(results) == 1
         assert "×" in results[0]["title"]  # Decoded HTML entity
 
     @pytest.mark.asyncio
-    async def test_deduplicates_by_sku(self):
+    async def test_deduplicates_by_sku(self, mock_http_client):
         """Test that products with same SKU are not duplicated."""
-        mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value=SAMPLE_API_RESPONSE)
-        mock_response.raise_for_status = MagicMock()
+        mock_client = mock_http_client(json_data=SAMPLE_API_RESPONSE)
 
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.armashop.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    # Search with two terms that return same products
-                    results = await scrape_armashop(search_terms=["sig", "glock"])
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            # Search with two terms that return same products
+            results = await scrape_armashop(search_terms=["sig", "glock"])
 
         # Should only have 2 results, not 4
         assert len(results) == 2
 
     @pytest.mark.asyncio
-    async def test_returns_empty_on_http_error(self):
-        """Test that HTTP errors return empty list."""
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError(
-            "Server Error",
-            request=MagicMock(),
-            response=MagicMock(status_code=500)
-        ))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.services.crawler.add_crawl_log"):
-                results = await scrape_armashop(search_terms=["sig"])
+    async def test_returns_empty_on_request_error(self, mock_http_client, request_error):
+        """Test that HTTP and connection errors return empty list."""
+        mock_client = mock_http_client(side_effect=request_error)
+
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            results = await scrape_armashop(search_terms=["sig"])
 
         assert results == []
 
@@ -164,20 +119,11 @@ class TestScrapeArmashop:
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_handles_empty_api_response(self):
+    async def test_handles_empty_api_response(self, mock_http_client):
         """Test handling of empty API response."""
-        mock_response = MagicMock()
-        mock_response.json = MagicMock(return_value=[])
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("backend.scrapers.armashop.create_http_client", return_value=mock_client):
-            with patch("backend.scrapers.armashop.delay_between_requests", new_callable=AsyncMock):
-                with patch("backend.services.crawler.add_crawl_log"):
-                    results = await scrape_armashop(search_terms=["nonexistent"])
+        mock_client = mock_http_client(json_data=[])
+
+        with patch_scraper("backend.scrapers.armashop", mock_client):
+            results = await scrape_armashop(search_terms=["nonexistent"])
 
         assert results == []
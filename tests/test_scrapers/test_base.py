@@ -15,6 +15,7 @@ import httpx
 import pytest
 
 from backend.scrapers.base import (
+    KEEPALIVE_EXPIRY,
     REQUEST_TIMEOUT,
     REQUEST_DELAY_MIN,
     REQUEST_DELAY_MAX,
@@ -107,6 +108,18 @@ class TestCreateHttpClient:
         finally:
             await client.aclose()
 
+    def test_keeps_connections_alive_across_delays(self):
+        """Idle connections should outlive the longest delay between requests."""
+        with patch("backend.scrapers.base.httpx.AsyncClient") as mock_client:
+            create_http_client()
+
+        limits = mock_client.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == KEEPALIVE_EXPIRY
+        # The pool stays bounded, as with httpx's default limits
+        assert limits.max_connections == 100
+        assert limits.max_keepalive_connections == 20
+        assert KEEPALIVE_EXPIRY > REQUEST_DELAY_MAX
+
 
 class TestDelayBetweenRequests:
     """Tests for delay_between_requests function."""
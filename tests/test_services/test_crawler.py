@@ -8,6 +8,8 @@ Tests the crawl orchestration:
 - Summary logging
 """
 import asyncio
+import os
+import time
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime, timezone
@@ -740,16 +742,16 @@ class TestCrawlStateHelpers:
 
     def test_is_crawl_running_false(self):
         """Test is_crawl_running when not running."""
-        _crawl_state.is_running = False
-        assert is_crawl_running() is False
+        assert is_crawl_running(CrawlState()) is False
 
     def test_is_crawl_running_true(self):
         """Test is_crawl_running when running."""
-        _crawl_state.is_running = True
-        try:
-            assert is_crawl_running() is True
-        finally:
-            _crawl_state.is_running = False
+        assert is_crawl_running(CrawlState(is_running=True)) is True
+
+    def test_is_crawl_running_when_locked(self, crawl_lock_path):
+        """Test is_crawl_running sees a crawl holding the lock in another process."""
+        crawl_lock_path.write_text(f"pid={os.getpid()}\ntimestamp={time.time()}\n")
+        assert is_crawl_running(CrawlState()) is True
 
     def test_is_cancel_requested_false(self):
         """Test is_cancel_requested when not requested."""
@@ -784,21 +786,17 @@ class TestRequestCrawlCancel:
 
     def test_cancel_when_running(self):
         """Test cancellation when crawl is running."""
-        _crawl_state.is_running = True
-        _crawl_state.cancel_requested = False
-        try:
-            result = request_crawl_cancel()
-            assert result is True
-            assert _crawl_state.cancel_requested is True
-        finally:
-            _crawl_state.is_running = False
-            _crawl_state.cancel_requested = False
+        state = CrawlState(is_running=True)
+        result = request_crawl_cancel(state)
+        assert result is True
+        assert state.cancel_requested is True
 
     def test_cancel_when_not_running(self):
         """Test cancellation when no crawl is running."""
-        _crawl_state.is_running = False
-        result = request_crawl_cancel()
+        state = CrawlState()
+        result = request_crawl_cancel(state)
         assert result is False
+        assert state.cancel_requested is False
 
 
 class TestPrepareCrawlState:
@@ -806,33 +804,23 @@ class TestPrepareCrawlState:
 
     def test_prepares_state(self):
         """Test prepare_crawl_state sets up state correctly."""
-        _crawl_state.is_running = False
-        _crawl_state.cancel_requested = True
-        _crawl_state.current_source = "old"
-        add_crawl_log("old log")
+        state = CrawlState(
+            cancel_requested=True, current_source="old", log_messages=["old log"]
+        )
 
-        try:
-            result = prepare_crawl_state()
-            assert result is True
-            assert _crawl_state.is_running is True
-            assert _crawl_state.cancel_requested is False
-            assert _crawl_state.current_source is None
-            # Log should have initial message
-            logs = get_crawl_log()
-            assert any("gestartet" in log.lower() for log in logs)
-        finally:
-            _crawl_state.is_running = False
-            _crawl_state.cancel_requested = False
-            clear_crawl_log()
+        result = prepare_crawl_state(state)
+        assert result is True
+        assert state.is_running is True
+        assert state.cancel_requested is False
+        assert state.current_source is None
+        # Log should only have the initial message
+        assert len(state.log_messages) == 1
+        assert "gestartet" in state.log_messages[0].lower()
 
     def test_fails_when_already_running(self):
         """Test prepare_crawl_state fails when already running."""
-        _crawl_state.is_running = True
-        try:
-            result = prepare_crawl_state()
-            assert result is False
-        finally:
-            _crawl_state.is_running = False
+        result = prepare_crawl_state(CrawlState(is_running=True))
+        assert result is False
 
 
 class TestLogCrawlSummary:
@@ -7,16 +7,6 @@ Tests verify:
 - Admin pages render correctly
 - Flash messages render with proper styles
 """
-import pytest
-from fastapi.testclient import TestClient
-
-from backend.main import app
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
 
 
 class TestDashboardTemplate: